@@ -29,6 +29,8 @@ import {
   AlertCircle,
   Bell,
   CheckCircle2,
+  ChevronLeft,
+  ChevronRight,
   FileText,
   Filter,
   Loader2,
@@ -63,6 +65,8 @@ const STORAGE_EMAIL_KEY = "admin_portal_email"
 
 const ADMIN_HINT = "Acesso restrito aos administradores"
 const LIMITE_DOCUMENTOS_VISIVEIS = 5
+const FORNECEDORES_POR_PAGINA = 50
+const FORNECEDORES_LOTE_RELATORIO = 200
 
 {/* Número real dos dados dos fornecedores */}
 
@@ -118,6 +122,23 @@ type NotificacaoItem = {
 
 type StatusFiltro = "TODOS" | "APROVADO" | "REPROVADO" | "PENDENTE"
 
+{/* Valor do parâmetro status de /api/admin/fornecedores para cada filtro */}
+
+const STATUS_FILTRO_API: Record<StatusFiltro, string> = {
+  TODOS: "",
+  APROVADO: "APROVADO",
+  REPROVADO: "REPROVADO",
+  PENDENTE: "EM_ANALISE,A CADASTRAR",
+}
+
+{/* Página devolvida por /api/admin/fornecedores quando limit é informado */}
+
+type PaginaFornecedores = {
+  fornecedores: FornecedorAdmin[]
+  total: number
+  proximoCursor: string | null
+}
+
 /**
  * Formata um número para exibição no formato brasileiro (pt-BR).
  * 
@@ -416,6 +437,47 @@ function adaptFornecedores(lista: unknown[]): FornecedorAdmin[] {
     })
 }
 
+/**
+ * Monta a query string paginada de /api/admin/fornecedores.
+ * 
+ * @param opcoes - Busca, filtro de status, ordenação, tamanho da página e cursor
+ * @returns Query string iniciada por "?"
+ */
+function montarConsultaFornecedores(opcoes: {
+  busca?: string
+  status?: StatusFiltro
+  ordenar?: string
+  limite?: number
+  cursor?: string | null
+}): string {
+  const params = new URLSearchParams()
+  params.set("limit", String(opcoes.limite ?? FORNECEDORES_POR_PAGINA))
+  if (opcoes.busca) params.set("search", opcoes.busca)
+  const status = opcoes.status ? STATUS_FILTRO_API[opcoes.status] : ""
+  if (status) params.set("status", status)
+  if (opcoes.ordenar) params.set("ordenar", opcoes.ordenar)
+  if (opcoes.cursor) params.set("cursor", opcoes.cursor)
+  return `?${params.toString()}`
+}
+
+/**
+ * Adapta a resposta paginada de /api/admin/fornecedores.
+ * 
+ * @param dados - Corpo da resposta já convertido de JSON
+ * @returns Fornecedores da página, total filtrado e cursor da próxima página,
+ *          ou null se a resposta não tiver o formato paginado
+ */
+function adaptPaginaFornecedores(dados: unknown): PaginaFornecedores | null {
+  if (!isJsonObject(dados) || !Array.isArray(dados.fornecedores)) return null
+  const fornecedores = adaptFornecedores(dados.fornecedores)
+  return {
+    fornecedores,
+    total: typeof dados.total === "number" ? dados.total : fornecedores.length,
+    proximoCursor:
+      typeof dados.proximo_cursor === "string" && dados.proximo_cursor ? dados.proximo_cursor : null,
+  }
+}
+
 /**
  * Normaliza o status de um fornecedor para um dos valores válidos.
  * 
@@ -498,6 +560,11 @@ export default function AdminDashboardPage() {
   const [isDarkMode, setIsDarkMode] = useState(false)
   const [dashboard, setDashboard] = useState<DashboardResumo | null>(null)
   const [fornecedores, setFornecedores] = useState<FornecedorAdmin[]>([])
+  const [totalFornecedores, setTotalFornecedores] = useState(0)
+  // Cursor de cada página visitada; a última posição é a página atual ("" = primeira)
+  const [cursoresPaginas, setCursoresPaginas] = useState<string[]>([""])
+  const [proximoCursor, setProximoCursor] = useState<string | null>(null)
+  const [recarregarFornecedores, setRecarregarFornecedores] = useState(0)
   const [notificacoes, setNotificacoes] = useState<NotificacaoItem[]>([])
   const [carregandoDashboard, setCarregandoDashboard] = useState(false)
   const [carregandoFornecedores, setCarregandoFornecedores] = useState(false)
@@ -535,17 +602,6 @@ export default function AdminDashboardPage() {
       ? excluindoFornecedorId === fornecedorParaExcluir.id
       : false
 
-  const totaisPorStatus = useMemo(() => (
-    fornecedores.reduce(
-      (acumulado, fornecedor) => {
-        const statusNormalizado = normalizarStatus(fornecedor.status)
-        acumulado[statusNormalizado] += 1
-        return acumulado
-      },
-      { APROVADO: 0, REPROVADO: 0, PENDENTE: 0 } as Record<"APROVADO" | "REPROVADO" | "PENDENTE", number>,
-    )
-  ), [fornecedores])
-
   const fornecedoresFiltrados = useMemo(() => {
     if (filtroStatus === "TODOS") {
       return fornecedores
@@ -566,27 +622,27 @@ export default function AdminDashboardPage() {
       valor: "TODOS" as StatusFiltro,
       rotulo: "Todos",
       descricao: "Mostrar todos os fornecedores",
-      contagem: fornecedores.length,
+      contagem: dashboard?.total_cadastrados ?? 0,
     },
     {
       valor: "APROVADO" as StatusFiltro,
       rotulo: "Aprovados",
       descricao: "Somente fornecedores homologados",
-      contagem: totaisPorStatus.APROVADO,
+      contagem: dashboard?.total_aprovados ?? 0,
     },
     {
       valor: "PENDENTE" as StatusFiltro,
       rotulo: "A cadastrar",
       descricao: "Cadastros aguardando decisão",
-      contagem: totaisPorStatus.PENDENTE,
+      contagem: dashboard?.total_em_analise ?? 0,
     },
     {
       valor: "REPROVADO" as StatusFiltro,
       rotulo: "Reprovados",
       descricao: "Fornecedores nao aprovados",
-      contagem: totaisPorStatus.REPROVADO,
+      contagem: dashboard?.total_reprovados ?? 0,
     },
-  ], [fornecedores.length, totaisPorStatus.APROVADO, totaisPorStatus.PENDENTE, totaisPorStatus.REPROVADO])
+  ], [dashboard])
 
   const filtroSelecionado = useMemo(
     () => opcoesFiltro.find((opcao) => opcao.valor === filtroStatus),
@@ -684,6 +740,8 @@ export default function AdminDashboardPage() {
     if (!token) {
       setDashboard(null)
       setFornecedores([])
+      setTotalFornecedores(0)
+      setProximoCursor(null)
       setNotificacoes([])
       setNotificacoesAbertas(false)
       setMostrarIndicadorNotificacoes(false)
@@ -768,6 +826,15 @@ export default function AdminDashboardPage() {
     setFiltroAberto(false)
   }
 
+  const handlePaginaAnterior = () => {
+    setCursoresPaginas((prev) => (prev.length > 1 ? prev.slice(0, -1) : prev))
+  }
+
+  const handleProximaPagina = () => {
+    if (!proximoCursor) return
+    setCursoresPaginas((prev) => [...prev, proximoCursor])
+  }
+
 {/* Função de decisão para aprovar ou reprovar o fornecedor */}
 
   const handleRegistrarDecisao = async (fornecedor: FornecedorAdmin, status: "APROVADO" | "REPROVADO") => {
@@ -813,17 +880,7 @@ export default function AdminDashboardPage() {
           )
         }
       } else {
-        const params = buscaDebounced ? `?search=${encodeURIComponent(buscaDebounced)}` : ""
-        const listaResposta = await authorizedFetch(`/api/admin/fornecedores${params}`)
-        const listaDados = await parseJsonSafe(listaResposta)
-        if (Array.isArray(listaDados)) {
-          setFornecedores(adaptFornecedores(listaDados))
-        } else if (isJsonObject(listaDados) && Array.isArray(listaDados.fornecedores)) {
-          setFornecedores(adaptFornecedores(listaDados.fornecedores))
-        } else {
-          setFornecedores([])
-          setErro(getMessageFromData(listaDados, "Não foi possivel atualizar a lista de fornecedores apos a decisão."))
-        }
+        setRecarregarFornecedores((valor) => valor + 1)
       }
 
       const emailEnviadoRaw = dadosRegistro?.emailEnviado
@@ -904,6 +961,7 @@ export default function AdminDashboardPage() {
       }
 
       setFornecedores((prev) => prev.filter((item) => item.id !== fornecedorParaExcluir.id))
+      setTotalFornecedores((prev) => Math.max(0, prev - 1))
       const mensagem = getMessageFromData(
         dados,
         `Fornecedor ${fornecedorParaExcluir.nome} excluido com sucesso.`,
@@ -1202,51 +1260,113 @@ export default function AdminDashboardPage() {
     carregarNotificacoes()
   }, [token])
 
+  // Nova busca ou novo filtro voltam para a primeira página
+  useEffect(() => {
+    setCursoresPaginas([""])
+  }, [buscaDebounced, filtroStatus])
+
+  const cursorPaginaAtual = cursoresPaginas[cursoresPaginas.length - 1]
+
   useEffect(() => {
     if (!token) return
+    // Descarta respostas de uma página que deixou de ser a atual
+    let cancelado = false
     const carregarFornecedores = async () => {
       try {
         setCarregandoFornecedores(true)
-        const params = buscaDebounced ? `?search=${encodeURIComponent(buscaDebounced)}` : ""
+        const params = montarConsultaFornecedores({
+          busca: buscaDebounced,
+          status: filtroStatus,
+          cursor: cursorPaginaAtual,
+        })
         const resposta = await authorizedFetch(`/api/admin/fornecedores${params}`)
         const dados = await parseJsonSafe(resposta)
+        if (cancelado) return
         if (!resposta.ok) {
           setFornecedores([])
+          setTotalFornecedores(0)
+          setProximoCursor(null)
           setErro(getMessageFromData(dados, "Falha ao carregar a lista de fornecedores."))
           return
         }
-        if (Array.isArray(dados)) {
-          setFornecedores(adaptFornecedores(dados))
-          return
-        }
-        if (isJsonObject(dados) && Array.isArray(dados.fornecedores)) {
-          setFornecedores(adaptFornecedores(dados.fornecedores))
+        const pagina = adaptPaginaFornecedores(dados)
+        if (pagina) {
+          setFornecedores(pagina.fornecedores)
+          setTotalFornecedores(pagina.total)
+          setProximoCursor(pagina.proximoCursor)
           return
         }
         setFornecedores([])
+        setTotalFornecedores(0)
+        setProximoCursor(null)
         const mensagemFornecedores = getMessageFromData(dados, "")
         if (mensagemFornecedores) {
           setErro(mensagemFornecedores)
         }
       } catch (error) {
+        if (cancelado) return
         console.error(error)
         setErro("Falha ao carregar a lista de fornecedores.")
       } finally {
-        setCarregandoFornecedores(false)
+        if (!cancelado) {
+          setCarregandoFornecedores(false)
+        }
       }
     }
 
     carregarFornecedores()
-  }, [buscaDebounced, token])
+    return () => {
+      cancelado = true
+    }
+  }, [buscaDebounced, filtroStatus, cursorPaginaAtual, recarregarFornecedores, token])
+
+  /**
+   * Busca os fornecedores cadastrados a partir de uma data.
+   * 
+   * Percorre /api/admin/fornecedores do cadastro mais recente para o mais
+   * antigo, em páginas de FORNECEDORES_LOTE_RELATORIO, e para na primeira
+   * página que já alcança cadastros anteriores ao início do período.
+   * 
+   * @param inicio - Data inicial (inclusiva) do período
+   * @returns Fornecedores cadastrados a partir de `inicio`
+   */
+  const buscarFornecedoresCadastradosDesde = async (inicio: Date): Promise<FornecedorAdmin[]> => {
+    const encontrados: FornecedorAdmin[] = []
+    let cursor: string | null = null
+    do {
+      const params = montarConsultaFornecedores({
+        ordenar: "-data_cadastro",
+        limite: FORNECEDORES_LOTE_RELATORIO,
+        cursor,
+      })
+      const resposta = await authorizedFetch(`/api/admin/fornecedores${params}`)
+      const pagina = adaptPaginaFornecedores(await parseJsonSafe(resposta))
+      if (!resposta.ok || !pagina) {
+        throw new Error("Falha ao carregar fornecedores do relatório")
+      }
+      let alcancouInicio = false
+      for (const fornecedor of pagina.fornecedores) {
+        const dataCadastro = fornecedor.data_cadastro ? new Date(fornecedor.data_cadastro) : null
+        if (!dataCadastro || Number.isNaN(dataCadastro.getTime())) continue
+        if (dataCadastro < inicio) {
+          alcancouInicio = true
+          break
+        }
+        encontrados.push(fornecedor)
+      }
+      cursor = alcancouInicio ? null : pagina.proximoCursor
+    } while (cursor)
+    return encontrados
+  }
 
   /**
    * Gera relatório mensal em PDF com estatísticas dos fornecedores.
    * 
-   * Filtra fornecedores cadastrados no mês atual, calcula totais por status,
+   * Busca na API os fornecedores cadastrados no mês atual, calcula totais por status,
    * cria HTML formatado com cards de resumo e tabela detalhada, e gera PDF
    * usando jsPDF e html2canvas. Faz download automático do PDF gerado.
    */
-  const handleGenerateMonthlyReport = () => {
+  const handleGenerateMonthlyReport = async () => {
     if (gerandoRelatorio || typeof window === "undefined") {
       return
     }
@@ -1254,17 +1374,20 @@ export default function AdminDashboardPage() {
     setGerandoRelatorio(true)
     setErro(null)
 
+    // A janela é aberta ainda dentro do clique, antes de esperar a API, para
+    // não ser barrada pelo bloqueador de pop-ups
+    const popup = window.open("", "_blank", "width=900,height=720")
+
     try {
+      if (!popup || popup.closed) {
+        throw new Error("popup_closed")
+      }
+
       const agora = new Date()
-      const mesAtual = agora.getMonth()
-      const anoAtual = agora.getFullYear()
-
-      const fornecedoresDoMes = fornecedores.filter((fornecedor) => {
-        if (!fornecedor.data_cadastro) return false
-        const dataCadastro = new Date(fornecedor.data_cadastro)
-        if (Number.isNaN(dataCadastro.getTime())) return false
-        return dataCadastro.getMonth() === mesAtual && dataCadastro.getFullYear() === anoAtual
-      })
+      const inicioMes = new Date(agora.getFullYear(), agora.getMonth(), 1)
+
+      // A lista da tela tem só a página atual; o relatório busca o mês inteiro
+      const fornecedoresDoMes = await buscarFornecedoresCadastradosDesde(inicioMes)
 
       const totais = fornecedoresDoMes.reduce(
         (acumulado, fornecedor) => {
@@ -1330,11 +1453,6 @@ export default function AdminDashboardPage() {
       const emptyStateHtml =
         totais.total === 0 ? '<p class="empty-state">Não há fornecedores cadastrados neste mês.</p>' : ""
 
-      const popup = window.open("", "_blank", "width=900,height=720")
-      if (!popup || popup.closed) {
-        throw new Error("popup_closed")
-      }
-
       const htmlContent = `<!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -1478,6 +1596,9 @@ export default function AdminDashboardPage() {
       }, 800)
     } catch (error) {
       console.error(error)
+      if (popup && !popup.closed) {
+        popup.close()
+      }
       setGerandoRelatorio(false)
       setErro("Não foi possível gerar o relatório mensal. Tente novamente.")
     }
@@ -1887,7 +2008,7 @@ export default function AdminDashboardPage() {
                               isDarkMode ? "bg-slate-700 text-slate-200" : "bg-slate-200 text-slate-600"
                             }`}
                           >
-                            {fornecedoresFiltrados.length}
+                            {totalFornecedores}
                           </span>
                         )}
                       </button>
@@ -2340,6 +2461,48 @@ export default function AdminDashboardPage() {
                     </div>
                   </div>
                 </div>
+                {totalFornecedores > 0 && (
+                  <div
+                    className={`flex flex-col sm:flex-row items-center justify-between gap-3 px-6 py-4 border-t text-sm ${
+                      isDarkMode ? "border-slate-700 text-slate-400" : "border-slate-200 text-slate-500"
+                    }`}
+                  >
+                    <span>
+                      Exibindo {formatNumber((cursoresPaginas.length - 1) * FORNECEDORES_POR_PAGINA + 1)}–
+                      {formatNumber((cursoresPaginas.length - 1) * FORNECEDORES_POR_PAGINA + fornecedores.length)} de{" "}
+                      {formatNumber(totalFornecedores)} fornecedores
+                    </span>
+                    <div className="flex items-center gap-3">
+                      <button
+                        type="button"
+                        onClick={handlePaginaAnterior}
+                        disabled={carregandoFornecedores || cursoresPaginas.length <= 1}
+                        className={`flex items-center gap-1 border rounded-xl px-3 py-1.5 transition-colors duration-200 disabled:cursor-not-allowed disabled:opacity-50 ${
+                          isDarkMode
+                            ? "border-slate-700 text-slate-300 hover:bg-slate-800"
+                            : "border-slate-300 text-slate-600 hover:bg-slate-100"
+                        }`}
+                      >
+                        <ChevronLeft className="w-4 h-4" /> Anterior
+                      </button>
+                      <span>
+                        Página {cursoresPaginas.length} de {Math.max(1, Math.ceil(totalFornecedores / FORNECEDORES_POR_PAGINA))}
+                      </span>
+                      <button
+                        type="button"
+                        onClick={handleProximaPagina}
+                        disabled={carregandoFornecedores || !proximoCursor}
+                        className={`flex items-center gap-1 border rounded-xl px-3 py-1.5 transition-colors duration-200 disabled:cursor-not-allowed disabled:opacity-50 ${
+                          isDarkMode
+                            ? "border-slate-700 text-slate-300 hover:bg-slate-800"
+                            : "border-slate-300 text-slate-600 hover:bg-slate-100"
+                        }`}
+                      >
+                        Próxima <ChevronRight className="w-4 h-4" />
+                      </button>
+                    </div>
+                  </div>
+                )}
               </div>
             </section>
 
@@ -2356,7 +2519,7 @@ export default function AdminDashboardPage() {
               </p>
               <button
                 onClick={handleGenerateMonthlyReport}
-                disabled={gerandoRelatorio || carregandoFornecedores || fornecedores.length === 0}
+                disabled={gerandoRelatorio || !dashboard?.total_cadastrados}
                 className={`flex items-center gap-2 text-white px-4 py-2 rounded-xl text-sm font-medium shadow-lg transition-all duration-300 hover:-translate-y-0.5 disabled:cursor-not-allowed disabled:opacity-70 disabled:hover:-translate-y-0 ${
                   isDarkMode
                     ? "bg-gradient-to-r from-orange-400 to-red-500 shadow-orange-500/20 hover:shadow-orange-500/30"
@@ -17,12 +17,16 @@ export default function NewPassword() {
   const [isDarkMode, setIsDarkMode] = useState(false)
   const [errors, setErrors] = useState<string[]>([])
   const [token, setToken] = useState<string | null>(null)
+  const [email, setEmail] = useState<string | null>(null)
   const [toastMessage, setToastMessage] = useState<string | null>(null)
   const [toastType, setToastType] = useState<"success" | "error">("success")
 
   useEffect(() => {
-    const urlToken = new URLSearchParams(window.location.search).get("token")
+    const params = new URLSearchParams(window.location.search)
+    const urlToken = params.get("token")
+    const urlEmail = params.get("email")
     if (urlToken) setToken(urlToken)
+    if (urlEmail) setEmail(urlEmail)
   }, [])
 
   useEffect(() => {
@@ -58,8 +62,8 @@ export default function NewPassword() {
 
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault()
-    if (!token) {
-      showToast("Token não encontrado na URL.", "error")
+    if (!token || !email) {
+      showToast("Token ou e-mail não encontrado na URL.", "error")
       return
     }
 
@@ -81,7 +85,7 @@ export default function NewPassword() {
       const response = await fetch(`${API_BASE}/api/redefinir-senha`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ token, nova_senha: password }),
+        body: JSON.stringify({ token, email, nova_senha: password }),
       })
 
       const { json, text } = await parseJsonSafe(response)
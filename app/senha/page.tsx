@@ -11,6 +11,7 @@ const API_BASE = process.env.NEXT_PUBLIC_API_URL || "https://backend-engeman-1.o
 
 export default function SenhaPage() {
   const [email, setEmail] = useState("")
+  const [sentEmail, setSentEmail] = useState("")
   const [isLoading, setIsLoading] = useState(false)
   const [showModal, setShowModal] = useState(false)
   const [isDarkMode, setIsDarkMode] = useState(false)
@@ -76,6 +77,7 @@ const handleSubmit = async (e: React.FormEvent) => {
       }
 
       showToast(json.message, "success")
+      setSentEmail(email)
       setShowModal(true)
       setEmail("")
     } catch (err) {
@@ -276,14 +278,14 @@ const handleSubmit = async (e: React.FormEvent) => {
             </div>
             <h3 className="text-xl font-semibold mb-2">Email Enviado!</h3>
             <p className={`mb-6 ${isDarkMode ? "text-slate-300" : "text-slate-600"}`}>
-              Enviamos as instruções de recuperação para <strong>{email}</strong>. Verifique sua caixa de entrada e
+              Enviamos as instruções de recuperação para <strong>{sentEmail}</strong>. Verifique sua caixa de entrada e
               spam.
             </p>
             <button
               onClick={() => setShowModal(false)}
               className="w-full h-12 bg-gradient-to-r from-orange-400 to-red-500 text-white rounded-lg font-semibold transition-all duration-300 hover:-translate-y-0.5 hover:shadow-lg hover:shadow-orange-400/25"
             >
-              <Link href = "/token">
+              <Link href = {`/token?email=${encodeURIComponent(sentEmail)}`}>
               Entendi
               </Link>
             </button>
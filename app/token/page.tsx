@@ -10,12 +10,18 @@ import Link from "next/link"
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || "https://backend-engeman-1.onrender.com"
 export default function ValidarToken() {
   const [token, setToken] = useState("")
+  const [email, setEmail] = useState("")
   const [isLoading, setIsLoading] = useState(false)
   const [showModal, setShowModal] = useState(false)
   const [isDarkMode, setIsDarkMode] = useState(false)
   const [toastMessage, setToastMessage] = useState<string | null>(null)
   const [toastType, setToastType] = useState<"success" | "error">("success")
 
+  useEffect(() => {
+    const urlEmail = new URLSearchParams(window.location.search).get("email")
+    if (urlEmail) setEmail(urlEmail)
+  }, [])
+
   useEffect(() => {
     const currentTheme = localStorage.getItem("theme") || "light"
     setIsDarkMode(currentTheme === "dark")
@@ -55,7 +61,7 @@ export default function ValidarToken() {
       const response = await fetch(`${API_BASE}/api/validar-token`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ token }),
+        body: JSON.stringify({ token, email }),
       })
       const { json, text } = await parseJsonSafe(response)
 
@@ -71,7 +77,7 @@ export default function ValidarToken() {
 
       showToast(json.message, "success")
       setTimeout(() => {
-        window.location.href = `/resetar-senha?token=${token}`
+        window.location.href = `/resetar-senha?token=${encodeURIComponent(token)}&email=${encodeURIComponent(email)}`
       }, 1500)
     } catch {
       showToast("Erro de rede ou servidor.", "error")
@@ -96,10 +102,19 @@ export default function ValidarToken() {
           <h1 className="text-2xl font-bold">
             <Link href="/validacao"> Validar Token</Link>
           </h1>
-          <p className={`text-sm ${isDarkMode ? "text-slate-400" : "text-slate-500"}`}>Digite o código de 6 dígitos enviado por e-mail</p>
+          <p className={`text-sm ${isDarkMode ? "text-slate-400" : "text-slate-500"}`}>Digite seu e-mail e o código de 6 dígitos enviado para ele</p>
         </div>
 
         <form onSubmit={handleSubmit} className="space-y-6">
+          <input
+            type="email"
+            placeholder="seu@email.com"
+            value={email}
+            onChange={(e) => setEmail(e.target.value)}
+            className="w-full h-12 px-4 border rounded-lg focus:outline-none focus:border-orange-400 focus:ring-3 focus:ring-orange-400/10 dark:bg-slate-700 dark:border-slate-600 dark:text-white"
+            required
+          />
+
           <input
             type="text"
             placeholder="Código de 6 dígitos"
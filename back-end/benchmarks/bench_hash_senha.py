@@ -0,0 +1,82 @@
+"""
+Benchmark de vazão do hash de senhas (logins por segundo).
+
+Para cada método, gera um hash e mede quantas verificações (check_password_hash,
+o trabalho de CPU de um login) cabem por segundo em um processo e com
+--processos processos em paralelo. Métodos comparados:
+    - werkzeug-padrao: 'pbkdf2:sha256' sem custo explícito, como o login usava
+      (1.000.000 de iterações no Werkzeug 3.1);
+    - configurado: o método de Config.SENHA_HASH_* (ou das variáveis de ambiente);
+    - calibrado: resultado de calibrar_custo para --alvo-ms, se informado;
+    - os métodos extras passados em --metodo.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_hash_senha.py --segundos 3 --processos 4
+    python benchmarks/bench_hash_senha.py --alvo-ms 50 --metodo scrypt:16384:8:1
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import senhas  # noqa: E402
+from config import Config  # noqa: E402
+
+SENHA = 'SenhaDeTeste#2024'
+
+
+def _verificacoes_por_segundo(hash_senha, segundos):
+    """Verificações feitas em sequência durante `segundos`."""
+    quantidade = 0
+    inicio = time.perf_counter()
+    while True:
+        assert senhas.verificar_senha(hash_senha, SENHA)
+        quantidade += 1
+        decorrido = time.perf_counter() - inicio
+        if decorrido >= segundos:
+            return quantidade / decorrido
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segundos', type=float, default=3.0, help='Duração de cada medição')
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--alvo-ms', type=float, default=None, help='Inclui o método calibrado para este alvo')
+    parser.add_argument('--metodo', action='append', default=[], help='Método extra no formato do Werkzeug')
+    args = parser.parse_args()
+
+    metodos = [
+        ('werkzeug-padrao', 'pbkdf2:sha256'),
+        ('configurado', senhas.metodo_hash(
+            Config.SENHA_HASH_ALGORITMO,
+            iteracoes=Config.SENHA_PBKDF2_ITERACOES,
+            scrypt_n=Config.SENHA_SCRYPT_N,
+            scrypt_r=Config.SENHA_SCRYPT_R,
+            scrypt_p=Config.SENHA_SCRYPT_P,
+        )),
+    ]
+    if args.alvo_ms:
+        _, metodo, _ = senhas.calibrar_custo(Config.SENHA_HASH_ALGORITMO, args.alvo_ms)
+        metodos.append((f'calibrado ({args.alvo_ms:.0f} ms)', metodo))
+    metodos.extend((metodo, metodo) for metodo in args.metodo)
+
+    print(f'{"método":28} {"parâmetros":24} {"ms/login":>9} {"logins/s":>9} '
+          f'{f"logins/s ({args.processos} proc)":>22}')
+    with ProcessPoolExecutor(max_workers=args.processos) as executor:
+        for nome, metodo in metodos:
+            hash_senha = senhas.gerar_hash_senha(SENHA, metodo)
+            sequencial = _verificacoes_por_segundo(hash_senha, args.segundos)
+            paralelo = sum(executor.map(
+                _verificacoes_por_segundo,
+                [hash_senha] * args.processos,
+                [args.segundos] * args.processos,
+            ))
+            parametros = hash_senha.split('$', 1)[0]
+            print(f'{nome:28} {parametros:24} {1000 / sequencial:9.1f} {sequencial:9.1f} {paralelo:22.1f}')
+
+
+if __name__ == '__main__':
+    main()
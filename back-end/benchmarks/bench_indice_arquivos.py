@@ -0,0 +1,137 @@
+"""
+Benchmark da localização de documentos antigos nas pastas de upload.
+
+Cria uma árvore sintética (por padrão 100 mil arquivos em 1000 pastas de
+fornecedores) e compara, para uma amostra de documentos:
+    - legado: para cada documento, os.path.isfile das variações de nome em
+      cada diretório candidato e, se não achar, os.listdir + normalização de
+      todos os diretórios (a implementação anterior de
+      _carregar_documento_de_fontes);
+    - índice: uma varredura única (IndiceArquivosDocumentos) e consultas a
+      dicionário por documento.
+
+Os dois caminhos devem encontrar exatamente os mesmos arquivos; o script
+aborta se houver divergência.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_indice_arquivos.py --arquivos 100000 --pastas 1000 --amostra 500
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as portal  # noqa: E402
+
+
+def _localizar_legado(documento):
+    """Cópia da busca anterior (sem leitura do conteúdo)."""
+    nomes_candidatos = portal._nomes_documento_candidatos(documento.nome_documento)
+    diretorios = portal._diretorios_documento_candidatos(documento.fornecedor_id)
+    caminhos_vistos = set()
+    for diretorio in diretorios:
+        for nome in nomes_candidatos:
+            caminho = os.path.abspath(os.path.join(diretorio, nome))
+            if caminho in caminhos_vistos:
+                continue
+            caminhos_vistos.add(caminho)
+            if os.path.isfile(caminho):
+                return caminho
+    alvo_normalizado = portal._normalizar_nome_documento(documento.nome_documento)
+    if not alvo_normalizado:
+        return None
+    for diretorio in diretorios:
+        if not os.path.isdir(diretorio):
+            continue
+        for entrada in os.listdir(diretorio):
+            caminho = os.path.abspath(os.path.join(diretorio, entrada))
+            if caminho in caminhos_vistos or not os.path.isfile(caminho):
+                continue
+            if portal._normalizar_nome_documento(entrada) == alvo_normalizado:
+                return caminho
+    return None
+
+
+def _localizar_indice(indice, documento):
+    caminhos = indice.caminhos_candidatos(documento)
+    return caminhos[0] if caminhos else None
+
+
+def _criar_arvore(raiz, arquivos, pastas):
+    nomes = []
+    for posicao in range(arquivos):
+        fornecedor_id = posicao % pastas + 1
+        pasta = os.path.join(raiz, str(fornecedor_id))
+        if posicao < pastas:
+            os.makedirs(pasta, exist_ok=True)
+        nome = f'Certidao_{posicao:06d}.pdf'
+        with open(os.path.join(pasta, nome), 'wb'):
+            pass
+        nomes.append((fornecedor_id, nome))
+    return nomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--arquivos', type=int, default=100_000)
+    parser.add_argument('--pastas', type=int, default=1000)
+    parser.add_argument('--amostra', type=int, default=500)
+    args = parser.parse_args()
+
+    raiz = tempfile.mkdtemp(prefix='bench_uploads_')
+    try:
+        inicio = time.perf_counter()
+        nomes = _criar_arvore(raiz, args.arquivos, args.pastas)
+        print(f'Árvore com {args.arquivos} arquivos criada em {time.perf_counter() - inicio:.1f}s')
+
+        portal.UPLOAD_FOLDER = raiz
+        portal.app.config['UPLOAD_FOLDER'] = raiz
+
+        rng = random.Random(42)
+        documentos = []
+        for fornecedor_id, nome in rng.sample(nomes, args.amostra):
+            variacao = rng.choice(('exato', 'espacos', 'ausente'))
+            if variacao == 'espacos':
+                # Só é encontrado pela comparação de nomes normalizados
+                nome = nome.replace('_', ' ').upper()
+            elif variacao == 'ausente':
+                nome = 'inexistente_' + nome
+            documentos.append(SimpleNamespace(id=len(documentos), nome_documento=nome, fornecedor_id=fornecedor_id))
+
+        with portal.app.app_context():
+            inicio = time.perf_counter()
+            resultado_legado = [_localizar_legado(documento) for documento in documentos]
+            tempo_legado = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            indice = portal.IndiceArquivosDocumentos.construir()
+            tempo_construcao = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            resultado_indice = [_localizar_indice(indice, documento) for documento in documentos]
+            tempo_consultas = time.perf_counter() - inicio
+
+        divergencias = sum(1 for a, b in zip(resultado_legado, resultado_indice) if a != b)
+        encontrados = sum(1 for caminho in resultado_indice if caminho)
+        print(f'{args.amostra} documentos, {encontrados} encontrados, {divergencias} divergências')
+        print(f'{"legado (isfile + listdir por documento)":45} {tempo_legado:9.3f}s '
+              f'({tempo_legado / args.amostra * 1000:.2f} ms/doc)')
+        print(f'{"índice: construção (uma vez)":45} {tempo_construcao:9.3f}s '
+              f'({indice.total_arquivos} arquivos)')
+        print(f'{"índice: consultas":45} {tempo_consultas:9.3f}s '
+              f'({tempo_consultas / args.amostra * 1000:.3f} ms/doc)')
+        print(f'{"ganho (legado / construção + consultas)":45} '
+              f'{tempo_legado / (tempo_construcao + tempo_consultas):8.1f}x')
+        if divergencias:
+            sys.exit(1)
+    finally:
+        shutil.rmtree(raiz, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark de cold start: tempo da importação do app até a primeira resposta.
+
+Executa cada modo em um processo novo (como um worker do gunicorn subindo):
+    - padrao: db.create_all() + inspeção/ALTER de schema na importação;
+    - rapida: INICIALIZACAO_RAPIDA=true, schema garantido pelas migrações.
+
+O banco é preparado uma vez com 'flask db upgrade'. Com um PostgreSQL remoto
+(--database-url), a diferença inclui as idas e voltas de rede da inspeção.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_inicializacao.py --repeticoes 5
+    python benchmarks/bench_inicializacao.py --database-url postgresql://...
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEDICAO = '''
+import time
+inicio = time.perf_counter()
+import app
+cliente = app.app.test_client()
+resposta = cliente.get('/api/fornecedores')
+assert resposta.status_code == 200, resposta.status_code
+print(time.perf_counter() - inicio)
+'''
+
+
+def _ambiente(database_url, rapida):
+    ambiente = dict(os.environ)
+    ambiente['DATABASE_URL'] = database_url
+    ambiente['INICIALIZACAO_RAPIDA'] = 'true' if rapida else 'false'
+    ambiente['PYTHONPATH'] = RAIZ_BACKEND + os.pathsep + ambiente.get('PYTHONPATH', '')
+    return ambiente
+
+
+def _medir(database_url, rapida):
+    saida = subprocess.run(
+        [sys.executable, '-c', MEDICAO],
+        cwd=RAIZ_BACKEND,
+        env=_ambiente(database_url, rapida),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(saida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--database-url', default=None, help='Padrão: SQLite temporário')
+    args = parser.parse_args()
+
+    temporario = None
+    database_url = args.database_url
+    if database_url is None:
+        temporario = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        temporario.close()
+        database_url = f'sqlite:///{temporario.name}'
+
+    try:
+        subprocess.run(
+            [sys.executable, '-m', 'flask', '--app', 'app', 'db', 'upgrade'],
+            cwd=RAIZ_BACKEND,
+            env=_ambiente(database_url, rapida=True),
+            capture_output=True,
+            check=True,
+        )
+        # Primeira importação descartada: aquece o cache de bytecode e do sistema de arquivos
+        _medir(database_url, rapida=True)
+
+        resultados = {}
+        for nome, rapida in (('padrao', False), ('rapida', True)):
+            resultados[nome] = [_medir(database_url, rapida) for _ in range(args.repeticoes)]
+
+        print(f'{"modo":10} {"mediana (s)":>12} {"min (s)":>10} {"max (s)":>10}')
+        for nome, tempos in resultados.items():
+            print(f'{nome:10} {statistics.median(tempos):12.3f} {min(tempos):10.3f} {max(tempos):10.3f}')
+        ganho = statistics.median(resultados['padrao']) - statistics.median(resultados['rapida'])
+        print(f'diferença da mediana: {ganho * 1000:.0f} ms por processo')
+    finally:
+        if temporario is not None:
+            os.remove(temporario.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark da busca de fornecedor por e-mail no login.
+
+Popula um banco (por padrão SQLite temporário) com 100 mil fornecedores e
+compara, para uma amostra de e-mails com capitalização variada:
+    - ilike: Fornecedor.email.ilike(email), a busca anterior do login, que
+      não usa o índice único de email (varredura completa da tabela);
+    - normalizado: _buscar_fornecedor_por_email, igualdade na coluna
+      indexada email_normalizado.
+
+Também imprime o plano de execução das duas consultas e aborta se elas
+encontrarem fornecedores diferentes.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_login_email.py --fornecedores 100000 --amostra 500
+    python benchmarks/bench_login_email.py --database-url postgresql://...
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+RAIZ_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ_BACKEND)
+
+
+def _popular(portal, quantidade):
+    """Recria as tabelas e insere os fornecedores em lotes."""
+    portal.db.drop_all()
+    portal.db.create_all()
+    lote = []
+    for posicao in range(quantidade):
+        email = f'Contato.{posicao:06d}@Fornecedor{posicao % 97}.com.br'
+        lote.append({
+            'nome': f'Fornecedor {posicao}',
+            'email': email,
+            'email_normalizado': portal.normalizar_email(email),
+            'cnpj': f'{posicao:014d}',
+            'senha': 'x',
+        })
+        if len(lote) == 5000:
+            portal.db.session.execute(portal.Fornecedor.__table__.insert(), lote)
+            lote = []
+    if lote:
+        portal.db.session.execute(portal.Fornecedor.__table__.insert(), lote)
+    portal.db.session.commit()
+
+
+def _plano(portal, consulta):
+    """Plano de execução da consulta no banco em uso."""
+    sql = str(consulta.statement.compile(
+        dialect=portal.db.engine.dialect, compile_kwargs={'literal_binds': True}
+    ))
+    prefixo = 'EXPLAIN QUERY PLAN ' if portal.db.engine.dialect.name == 'sqlite' else 'EXPLAIN '
+    linhas = portal.db.session.execute(portal.text(prefixo + sql)).fetchall()
+    return '\n'.join('    ' + ' '.join(str(valor) for valor in linha) for linha in linhas)
+
+
+def _medir(funcao, emails):
+    inicio = time.perf_counter()
+    resultado = [funcao(email) for email in emails]
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fornecedores', type=int, default=100_000)
+    parser.add_argument('--amostra', type=int, default=500)
+    parser.add_argument('--database-url', default=None, help='Padrão: SQLite temporário')
+    args = parser.parse_args()
+
+    arquivo_temporario = None
+    if args.database_url:
+        os.environ['DATABASE_URL'] = args.database_url
+    else:
+        descritor, arquivo_temporario = tempfile.mkstemp(prefix='bench_login_', suffix='.db')
+        os.close(descritor)
+        os.environ['DATABASE_URL'] = f'sqlite:///{arquivo_temporario}'
+    os.environ['INICIALIZACAO_RAPIDA'] = 'true'
+
+    import app as portal  # noqa: E402
+
+    try:
+        with portal.app.app_context():
+            inicio = time.perf_counter()
+            _popular(portal, args.fornecedores)
+            print(f'{args.fornecedores} fornecedores inseridos em {time.perf_counter() - inicio:.1f}s')
+
+            rng = random.Random(42)
+            emails = []
+            for posicao in rng.sample(range(args.fornecedores), args.amostra):
+                email = f'contato.{posicao:06d}@fornecedor{posicao % 97}.com.br'
+                emails.append(rng.choice((email, email.upper(), f' {email.title()} ')))
+
+            def buscar_ilike(email):
+                fornecedor = portal.Fornecedor.query.filter(portal.Fornecedor.email.ilike(email.strip())).first()
+                return fornecedor.id if fornecedor else None
+
+            def buscar_normalizado(email):
+                fornecedor = portal._buscar_fornecedor_por_email(email)
+                return fornecedor.id if fornecedor else None
+
+            print('Plano (ilike):')
+            print(_plano(portal, portal.Fornecedor.query.filter(portal.Fornecedor.email.ilike(emails[0]))))
+            print('Plano (email_normalizado):')
+            print(_plano(portal, portal.Fornecedor.query.filter_by(
+                email_normalizado=portal.normalizar_email(emails[0])
+            )))
+
+            tempo_ilike, resultado_ilike = _medir(buscar_ilike, emails)
+            portal.db.session.expunge_all()
+            tempo_normalizado, resultado_normalizado = _medir(buscar_normalizado, emails)
+
+            divergencias = sum(1 for a, b in zip(resultado_ilike, resultado_normalizado) if a != b)
+            ausentes = sum(1 for fornecedor_id in resultado_normalizado if fornecedor_id is None)
+            print(f'{args.amostra} buscas, {ausentes} não encontradas, {divergencias} divergências')
+            print(f'{"ilike (varredura)":30} {tempo_ilike:9.3f}s '
+                  f'({tempo_ilike / args.amostra * 1000:.3f} ms/login)')
+            print(f'{"email_normalizado (índice)":30} {tempo_normalizado:9.3f}s '
+                  f'({tempo_normalizado / args.amostra * 1000:.3f} ms/login)')
+            print(f'{"ganho":30} {tempo_ilike / tempo_normalizado:8.1f}x')
+            if divergencias or ausentes:
+                sys.exit(1)
+    finally:
+        if arquivo_temporario:
+            os.remove(arquivo_temporario)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark das normalizações de texto: valor a valor x coluna inteira.
+
+Compara _normalizar_texto, _normalizar_chave e _normalize_text aplicadas valor
+a valor (como faziam os índices das planilhas) com _normalizar_texto_serie,
+_normalizar_chave_serie e _normalize_text_series em colunas sintéticas (por
+padrão 100 mil linhas):
+    - nomes: nomes de fornecedores com acentos, espaços e caixa variados,
+      repetidos como na planilha de controle de qualidade;
+    - unicode: textos aleatórios, todos distintos, com letras, marcas
+      combinantes, espaços Unicode, pontuação, números e nulos (None/NaN);
+    - code points: cada caractere do Unicode isolado e entre letras, o que
+      cobre as tabelas de remoção (combining, Mn, isalnum, isspace); essa
+      coluna é medida uma única vez.
+
+As versões por coluna devem devolver exatamente os mesmos textos que as
+escalares; o script aborta se houver divergência.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_normalizacao_texto.py --linhas 100000 --repeticoes 3
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('INICIALIZACAO_RAPIDA', 'true')
+
+import app as portal  # noqa: E402
+
+pd = portal.pd
+
+FUNCOES = [
+    ('_normalizar_texto', portal._normalizar_texto, portal._normalizar_texto_serie),
+    ('_normalizar_chave', portal._normalizar_chave, portal._normalizar_chave_serie),
+    ('_normalize_text', portal._normalize_text, portal._normalize_text_series),
+]
+
+PALAVRAS = [
+    'Comércio', 'Indústria', 'Construções', 'Serviços', 'Elétrica', 'Manutenção',
+    'São', 'João', 'Ação', 'Técnica', 'Engenharia', 'Transportes', 'Locação',
+    'Ltda.', 'LTDA', 'S/A', 'ME', 'EPP', '& Cia', 'Irmãos', 'Açougue', 'Pães',
+]
+ESPACOS = [' ', '  ', '\t', ' ', ' ', '　', '\n']
+
+
+def _coluna_nomes(linhas, gerador):
+    """Nomes de fornecedores com cerca de 2 mil valores distintos."""
+    distintos = []
+    for _ in range(2000):
+        palavras = gerador.sample(PALAVRAS, gerador.randint(2, 5))
+        nome = ''.join(palavra + gerador.choice(ESPACOS) for palavra in palavras)
+        if gerador.random() < 0.3:
+            nome = nome.upper()
+        distintos.append(gerador.choice(['', ' ']) + nome)
+    valores = [gerador.choice(distintos) for _ in range(linhas)]
+    for posicao in gerador.sample(range(linhas), linhas // 100):
+        valores[posicao] = gerador.choice([None, float('nan'), 12345, 3.5])
+    return pd.Series(valores, dtype=object)
+
+
+def _coluna_unicode(linhas, gerador):
+    """Textos aleatórios, todos distintos, cobrindo várias categorias Unicode."""
+    alfabeto = [
+        chr(codigo) for codigo in range(0x20, 0x3100)
+        if portal.unicodedata.category(chr(codigo))[0] in 'LMNPSZ'
+    ] + ESPACOS + ['_', 'ß', 'ǰ', 'İ', 'ͅ', 'ﬁ', '①', '½']
+    valores = []
+    for posicao in range(linhas):
+        if posicao % 97 == 0:
+            valores.append(gerador.choice([None, float('nan'), posicao, posicao / 7]))
+            continue
+        texto = ''.join(gerador.choices(alfabeto, k=gerador.randint(0, 40)))
+        valores.append(f'{texto}{posicao}')
+    return pd.Series(valores, dtype=object)
+
+
+def _coluna_code_points():
+    """Cada code point sozinho e entre letras (surrogates não formam str válidas para o pandas)."""
+    valores = []
+    for codigo in range(sys.maxunicode + 1):
+        if 0xD800 <= codigo <= 0xDFFF:
+            continue
+        caractere = chr(codigo)
+        valores.append(caractere)
+        valores.append(f'a{caractere}b')
+    return pd.Series(valores, dtype=object)
+
+
+def _medir(funcao, repeticoes):
+    """Menor tempo, em segundos, entre as repetições."""
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos), resultado
+
+
+def _divergencias(serie, esperado, obtido):
+    return [
+        (valor, antes, depois)
+        for valor, antes, depois in zip(serie.tolist(), esperado, obtido)
+        if antes != depois
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=100_000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=2024)
+    parser.add_argument('--sem-code-points', action='store_true', help='Não verifica todos os code points')
+    args = parser.parse_args()
+
+    gerador = random.Random(args.semente)
+    colunas = [
+        ('nomes', _coluna_nomes(args.linhas, gerador)),
+        ('unicode', _coluna_unicode(args.linhas, gerador)),
+    ]
+    if not args.sem_code_points:
+        colunas.append(('code points', _coluna_code_points()))
+
+    print(f'{"coluna":12} {"função":18} {"linhas":>8} {"distintos":>9} '
+          f'{"escalar (ms)":>13} {"coluna (ms)":>12} {"ganho":>7}')
+    divergencias = 0
+    for nome_coluna, serie in colunas:
+        distintos = serie.map(lambda valor: 'nan' if isinstance(valor, float) and math.isnan(valor) else valor)
+        distintos = distintos.nunique(dropna=False)
+        repeticoes = 1 if nome_coluna == 'code points' else args.repeticoes
+        for nome_funcao, escalar, por_coluna in FUNCOES:
+            tempo_escalar, esperado = _medir(lambda: [escalar(valor) for valor in serie.tolist()], repeticoes)
+            tempo_coluna, obtido = _medir(lambda: por_coluna(serie).tolist(), repeticoes)
+            diferentes = _divergencias(serie, esperado, obtido)
+            if diferentes:
+                divergencias += 1
+                print(f'DIVERGÊNCIA em {nome_funcao} ({nome_coluna}): {len(diferentes)} valores, '
+                      f'ex.: {[tuple(map(ascii, item)) for item in diferentes[:3]]}')
+            print(f'{nome_coluna:12} {nome_funcao:18} {len(serie):8d} {distintos:9d} '
+                  f'{tempo_escalar * 1000:13.1f} {tempo_coluna * 1000:12.1f} '
+                  f'{tempo_escalar / tempo_coluna:6.1f}x')
+    if divergencias:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark da carga das planilhas: Excel (openpyxl) x snapshot Arrow.
+
+Para cada planilha usada pela API (fornecedores_homologados.xlsx,
+atendimento controle_qualidade.xlsx e CLAF.xlsx) mede, em um processo sem
+cache em memória:
+    - xlsx: EsquemaPlanilha.ler_excel, o que cada worker novo faz na primeira
+      requisição sem snapshot;
+    - snapshot: _ler_excel com o snapshot Feather já gravado (memory map).
+
+O snapshot é gravado em um diretório temporário (PLANILHAS_SNAPSHOT_DIR), sem
+tocar nos arquivos do projeto, e o benchmark aborta se os dois caminhos
+devolverem DataFrames com valores diferentes.
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_snapshot_planilhas.py --repeticoes 5
+    python benchmarks/bench_snapshot_planilhas.py --planilha caminho/outra.xlsx
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ_BACKEND)
+
+
+def _medir(funcao, repeticoes):
+    """Menor tempo, em segundos, entre as repetições."""
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos), resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--planilha', action='append', default=[], help='Planilha extra a medir')
+    args = parser.parse_args()
+
+    diretorio_snapshots = tempfile.mkdtemp(prefix='bench_snapshot_')
+    os.environ['PLANILHAS_SNAPSHOT_DIR'] = diretorio_snapshots
+    os.environ['PLANILHAS_SNAPSHOT'] = 'true'
+    os.environ['INICIALIZACAO_RAPIDA'] = 'true'
+
+    import app as portal  # noqa: E402
+
+    if portal.pa is None:
+        sys.exit('pyarrow não está instalado: os snapshots ficam desabilitados.')
+
+    with portal.app.app_context():
+        planilhas = [
+            (portal._resolver_planilha('fornecedores_homologados.xlsx'), portal.ESQUEMA_HOMOLOGADOS),
+            (portal._resolver_planilha('atendimento controle_qualidade.xlsx'), portal.ESQUEMA_CONTROLE_QUALIDADE),
+        ]
+        try:
+            planilhas.append((portal._obter_caminho_claf(), portal.ESQUEMA_CLAF))
+        except FileNotFoundError:
+            pass
+        # Planilhas extras são lidas com o esquema da CLAF (material + documentos)
+        planilhas += [(caminho, portal.ESQUEMA_CLAF) for caminho in args.planilha]
+        planilhas = [(caminho, esquema) for caminho, esquema in planilhas if caminho]
+
+        print(f'{"planilha":40} {"linhas":>7} {"xlsx (ms)":>10} {"snapshot (ms)":>14} '
+              f'{"ganho":>7} {"snapshot (KB)":>14}')
+        total_xlsx = total_snapshot = 0.0
+        divergencias = 0
+        for caminho, esquema in planilhas:
+            tempo_xlsx, df_xlsx = _medir(lambda: esquema.ler_excel(caminho), args.repeticoes)
+            # A primeira leitura grava o snapshot; as medidas seguintes o reaproveitam
+            portal._ler_excel(caminho, esquema)
+            tempo_snapshot, df_snapshot = _medir(lambda: portal._ler_excel(caminho, esquema), args.repeticoes)
+            try:
+                portal.pd.testing.assert_frame_equal(df_xlsx, df_snapshot, check_dtype=False)
+            except AssertionError as exc:
+                divergencias += 1
+                print(f'DIVERGÊNCIA em {caminho}: {exc}')
+            tamanho = os.path.getsize(portal._caminho_snapshot(caminho)) / 1024
+            total_xlsx += tempo_xlsx
+            total_snapshot += tempo_snapshot
+            print(f'{os.path.basename(caminho)[:40]:40} {len(df_xlsx):7d} {tempo_xlsx * 1000:10.1f} '
+                  f'{tempo_snapshot * 1000:14.1f} {tempo_xlsx / tempo_snapshot:6.1f}x {tamanho:14.1f}')
+        print(f'{"total (carga a frio de um worker)":40} {"":7} {total_xlsx * 1000:10.1f} '
+              f'{total_snapshot * 1000:14.1f} {total_xlsx / total_snapshot:6.1f}x')
+        print(f'Snapshots: {portal._estatisticas_snapshots()}')
+
+    for nome in os.listdir(diretorio_snapshots):
+        os.remove(os.path.join(diretorio_snapshots, nome))
+    os.rmdir(diretorio_snapshots)
+    if divergencias:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Micro-benchmark da montagem dos e-mails HTML.
+
+Compara, por mensagem:
+    - legado: localizar o logo no disco, ler, codificar em base64 e substituir
+      'cid:engeman_logo' no corpo (o que enviar_email fazia a cada envio);
+    - atual: logo em cache (_carregar_logo_email) anexado inline por Content-ID.
+
+Também mede a renderização dos templates Jinja (compilados uma vez pelo Flask).
+
+Uso (a partir de back-end/):
+    python benchmarks/bench_templates_email.py --repeticoes 2000
+"""
+import argparse
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import render_template  # noqa: E402
+from flask_mail import Message  # noqa: E402
+
+import app as portal  # noqa: E402
+
+
+TEMPLATES = {
+    'emails/recuperacao_senha.html': {'fornecedor_nome': 'Empresa ABC Ltda', 'token': '123456'},
+    'emails/contato.html': {
+        'nome': 'Maria', 'email': 'maria@empresa.com', 'assunto': 'Cadastro', 'mensagem': 'Olá!'
+    },
+    'emails/documentos_recebidos.html': {
+        'fornecedor_nome': 'Empresa ABC Ltda', 'documento_nome': 'alvara.pdf', 'categoria': 'Material'
+    },
+    'emails/decisao_homologacao.html': {
+        'fornecedor_nome': 'Empresa ABC Ltda', 'status_legivel': 'aprovado', 'observacao': 'Ok'
+    },
+}
+
+
+def _mensagem_legado(corpo):
+    msg = Message('Teste', recipients=['x@exemplo.com'], html=corpo, sender='portal@exemplo.com')
+    caminho_logo = portal._resolver_logo_path()
+    if caminho_logo and os.path.exists(caminho_logo):
+        with open(caminho_logo, 'rb') as img:
+            encoded_img = base64.b64encode(img.read()).decode('utf-8')
+        msg.html = corpo.replace('cid:engeman_logo', f'data:image/png;base64,{encoded_img}')
+    return msg
+
+
+def _mensagem_atual(corpo):
+    msg = Message('Teste', recipients=['x@exemplo.com'], html=corpo, sender='portal@exemplo.com')
+    caminho_logo, dados_logo = portal._carregar_logo_email()
+    if dados_logo:
+        msg.attach(
+            os.path.basename(caminho_logo), 'image/png', dados_logo,
+            disposition='inline', headers={'Content-ID': f'<{portal.LOGO_EMAIL_CID}>'}
+        )
+    return msg
+
+
+def _cronometrar(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=2000)
+    args = parser.parse_args()
+
+    with portal.app.app_context():
+        print(f'{"template":40} {"render (us)":>12}')
+        for nome, contexto in TEMPLATES.items():
+            render_template(nome, **contexto)
+            media = _cronometrar(lambda: render_template(nome, **contexto), args.repeticoes)
+            print(f'{nome:40} {media:12.1f}')
+
+        corpo = render_template('emails/recuperacao_senha.html', **TEMPLATES['emails/recuperacao_senha.html'])
+        legado = _cronometrar(lambda: _mensagem_legado(corpo), args.repeticoes)
+        atual = _cronometrar(lambda: _mensagem_atual(corpo), args.repeticoes)
+        print()
+        print(f'{"montagem da mensagem com logo":40} {"us/msg":>12}')
+        print(f'{"legado (disco + base64 + replace)":40} {legado:12.1f}')
+        print(f'{"atual (cache + anexo inline)":40} {atual:12.1f}')
+        print(f'{"ganho":40} {legado / atual:11.1f}x')
+
+
+if __name__ == '__main__':
+    main()
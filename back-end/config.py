@@ -1,3 +1,7 @@
+import os
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'secret-key-here')
 
@@ -22,6 +26,10 @@ class Config:
     SQLALCHEMY_DATABASE_URI = _database_url
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Pula db.create_all() e os ajustes de schema na importação do app.
+    # Exige o banco atualizado com 'flask db upgrade' antes de subir os workers.
+    INICIALIZACAO_RAPIDA = os.environ.get('INICIALIZACAO_RAPIDA', 'false').lower() == 'true'
+
     _pool_recycle = int(os.environ.get('SQLALCHEMY_POOL_RECYCLE', 280))
 
     SQLALCHEMY_ENGINE_OPTIONS = {
@@ -30,3 +38,68 @@ class Config:
         'pool_size': 5,
         'max_overflow': 2,
     }
+
+    # Limites de upload: por arquivo (verificado durante a cópia em blocos) e
+    # por requisição (o Werkzeug responde 413 antes de ler o corpo)
+    UPLOAD_MAX_FILE_BYTES = int(os.environ.get('UPLOAD_MAX_FILE_BYTES', 20 * 1024 * 1024))
+    MAX_CONTENT_LENGTH = int(os.environ.get('UPLOAD_MAX_REQUEST_BYTES', 60 * 1024 * 1024))
+
+    # Servidor SMTP usado pelo Flask-Mail (para testes locais, um servidor como
+    # aiosmtpd em localhost:8025 pode ser usado no lugar do servidor real)
+    MAIL_SERVER = os.environ.get('MAIL_SERVER', 'localhost')
+    MAIL_PORT = int(os.environ.get('MAIL_PORT', 25))
+    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'false').lower() == 'true'
+    MAIL_USE_SSL = os.environ.get('MAIL_USE_SSL', 'false').lower() == 'true'
+    MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
+    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
+    MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER')
+
+    # Tentativas com token errado aceitas por pedido de recuperação de senha
+    TOKEN_RECUPERACAO_MAX_TENTATIVAS = int(os.environ.get('TOKEN_RECUPERACAO_MAX_TENTATIVAS', 5))
+
+    # Fila persistente de e-mails (tabela emails_pendentes)
+    EMAIL_FILA_MAX_TENTATIVAS = int(os.environ.get('EMAIL_FILA_MAX_TENTATIVAS', 5))
+    EMAIL_FILA_ESPERA_BASE = int(os.environ.get('EMAIL_FILA_ESPERA_BASE', 30))
+    EMAIL_FILA_ESPERA_MAXIMA = int(os.environ.get('EMAIL_FILA_ESPERA_MAXIMA', 3600))
+    EMAIL_FILA_RESERVA = int(os.environ.get('EMAIL_FILA_RESERVA', 300))
+    EMAIL_FILA_INTERVALO = float(os.environ.get('EMAIL_FILA_INTERVALO', 5))
+    # Segundos sem envio após os quais a sessão SMTP reaproveitada é encerrada
+    EMAIL_SMTP_OCIOSIDADE = float(os.environ.get('EMAIL_SMTP_OCIOSIDADE', 60))
+    # Indica que a fila é consumida por outro processo, o comando
+    # 'flask enviar-emails --continuo' (entrada 'worker' do Procfile)
+    EMAIL_FILA_WORKER_EXTERNO = os.environ.get('EMAIL_FILA_WORKER_EXTERNO', 'false').lower() == 'true'
+    # Envia a fila em uma thread dentro de cada processo web. Ligado por padrão
+    # quando não há worker externo, para que nenhum deploy fique sem consumidor;
+    # com as duas opções desligadas, enfileirar_email recusa a mensagem.
+    EMAIL_FILA_WORKER_THREAD = os.environ.get(
+        'EMAIL_FILA_WORKER_THREAD', 'false' if EMAIL_FILA_WORKER_EXTERNO else 'true'
+    ).lower() == 'true'
+
+    # Hash das senhas dos fornecedores: 'pbkdf2' (PBKDF2-SHA256) ou 'scrypt'.
+    # Use 'flask calibrar-hash-senha --alvo-ms 100' para escolher o custo no
+    # host de produção; hashes com outros parâmetros são regravados no login.
+    SENHA_HASH_ALGORITMO = os.environ.get('SENHA_HASH_ALGORITMO', 'pbkdf2')
+    SENHA_PBKDF2_ITERACOES = int(os.environ.get('SENHA_PBKDF2_ITERACOES', 600_000))
+    SENHA_SCRYPT_N = int(os.environ.get('SENHA_SCRYPT_N', 2 ** 15))
+    SENHA_SCRYPT_R = int(os.environ.get('SENHA_SCRYPT_R', 8))
+    SENHA_SCRYPT_P = int(os.environ.get('SENHA_SCRYPT_P', 1))
+
+    # Pool de processos que gera e verifica os hashes de senha (por processo
+    # web). Com a fila cheia, login/cadastro/redefinição respondem 503 com
+    # Retry-After. SENHA_POOL_PROCESSOS=0 executa o hash na própria thread.
+    # Cada operação em andamento prende uma thread do worker gthread enquanto
+    # espera o resultado, então SENHA_POOL_PROCESSOS + SENHA_POOL_FILA deve
+    # ficar abaixo de GUNICORN_THREADS (Procfile, padrão 6): com 2 + 2, uma
+    # rajada de logins ocupa no máximo 4 threads e as outras 2 continuam
+    # atendendo as demais rotas. O pool de conexões (5 + 2) cobre as 6 threads.
+    SENHA_POOL_PROCESSOS = int(os.environ.get('SENHA_POOL_PROCESSOS', 2))
+    SENHA_POOL_FILA = int(os.environ.get('SENHA_POOL_FILA', 2))
+    SENHA_POOL_ESPERA_MAXIMA = float(os.environ.get('SENHA_POOL_ESPERA_MAXIMA', 10))
+    SENHA_POOL_RETRY_AFTER = int(os.environ.get('SENHA_POOL_RETRY_AFTER', 2))
+
+    # Snapshots Arrow (Feather) das planilhas Excel, gravados na primeira leitura
+    # ao lado de cada .xlsx (ou em PLANILHAS_SNAPSHOT_DIR) e usados enquanto o
+    # conteúdo do arquivo não mudar. Requer o pacote pyarrow; sem ele, ou com
+    # PLANILHAS_SNAPSHOT=false, as planilhas são sempre lidas do Excel.
+    PLANILHAS_SNAPSHOT = os.environ.get('PLANILHAS_SNAPSHOT', 'true').lower() == 'true'
+    PLANILHAS_SNAPSHOT_DIR = os.environ.get('PLANILHAS_SNAPSHOT_DIR') or None
@@ -0,0 +1,81 @@
+"""esquema inicial
+
+Tabelas como eram criadas por db.create_all() antes dos ajustes feitos em
+tempo de execução por _ensure_nota_fornecedor_schema e _ensure_documento_schema.
+Bancos já existentes (criados por create_all) são mantidos: só as tabelas
+ausentes são criadas.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _tabelas_existentes():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade():
+    existentes = _tabelas_existentes()
+    if 'fornecedores' not in existentes:
+        op.create_table('fornecedores',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('email', sa.String(length=100), nullable=False),
+        sa.Column('cnpj', sa.String(length=18), nullable=False),
+        sa.Column('senha', sa.String(length=256), nullable=False),
+        sa.Column('token_recuperacao', sa.String(length=6), nullable=True),
+        sa.Column('token_expira', sa.DateTime(), nullable=True),
+        sa.Column('categoria', sa.String(length=100), nullable=True),
+        sa.Column('data_cadastro', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('cnpj'),
+        sa.UniqueConstraint('email')
+        )
+    if 'documentos' not in existentes:
+        op.create_table('documentos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('nome_documento', sa.String(length=100), nullable=False),
+        sa.Column('categoria', sa.String(length=50), nullable=False),
+        sa.Column('data_upload', sa.DateTime(), nullable=True),
+        sa.Column('fornecedor_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['fornecedor_id'], ['fornecedores.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'homologacoes' not in existentes:
+        op.create_table('homologacoes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('iqf', sa.Float(), nullable=False),
+        sa.Column('homologacao', sa.String(length=50), nullable=False),
+        sa.Column('observacoes', sa.Text(), nullable=True),
+        sa.Column('fornecedor_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['fornecedor_id'], ['fornecedores.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'notas_fornecedores' not in existentes:
+        op.create_table('notas_fornecedores',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('fornecedor_id', sa.Integer(), nullable=False),
+        sa.Column('nota_homologacao', sa.Float(), nullable=True),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['fornecedor_id'], ['fornecedores.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('fornecedor_id')
+        )
+
+
+def downgrade():
+    op.drop_table('notas_fornecedores')
+    op.drop_table('homologacoes')
+    op.drop_table('documentos')
+    op.drop_table('fornecedores')
@@ -0,0 +1,54 @@
+"""colunas de decisão das notas e conteúdo dos documentos
+
+Substitui os ALTER TABLE feitos na inicialização por
+_ensure_nota_fornecedor_schema e _ensure_documento_schema. Colunas que já
+existem (bancos ajustados por essas funções) são ignoradas.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+COLUNAS = {
+    'notas_fornecedores': [
+        sa.Column('status_decisao', sa.String(length=20), nullable=True),
+        sa.Column('observacao_admin', sa.Text(), nullable=True),
+        sa.Column('nota_referencia', sa.Float(), nullable=True),
+        sa.Column('email_enviado', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column('decisao_atualizada_em', sa.DateTime(), nullable=True),
+    ],
+    'documentos': [
+        sa.Column('mime_type', sa.String(length=255), nullable=True),
+        sa.Column('dados_arquivo', sa.LargeBinary(), nullable=True),
+    ],
+}
+
+
+def _colunas_existentes(tabela):
+    return {coluna['name'] for coluna in sa.inspect(op.get_bind()).get_columns(tabela)}
+
+
+def upgrade():
+    for tabela, colunas in COLUNAS.items():
+        existentes = _colunas_existentes(tabela)
+        for coluna in colunas:
+            if coluna.name not in existentes:
+                op.add_column(tabela, coluna)
+
+
+def downgrade():
+    for tabela, colunas in COLUNAS.items():
+        with op.batch_alter_table(tabela, schema=None) as batch_op:
+            for coluna in reversed(colunas):
+                batch_op.drop_column(coluna.name)
@@ -0,0 +1,78 @@
+"""armazenamento de blobs, fila de e-mails e progresso de tarefas
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    existentes = set(inspetor.get_table_names())
+
+    if 'arquivos_blob' not in existentes:
+        op.create_table('arquivos_blob',
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('tamanho', sa.BigInteger(), nullable=False),
+        sa.Column('referencias', sa.Integer(), nullable=False),
+        sa.Column('criado_em', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('sha256')
+        )
+
+    colunas_documentos = {coluna['name'] for coluna in inspetor.get_columns('documentos')}
+    if 'blob_sha256' not in colunas_documentos:
+        # batch_alter_table recria a tabela no SQLite, que não aceita ADD CONSTRAINT
+        with op.batch_alter_table('documentos', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('blob_sha256', sa.String(length=64), nullable=True))
+            batch_op.create_index('ix_documentos_blob_sha256', ['blob_sha256'], unique=False)
+            batch_op.create_foreign_key(
+                'fk_documentos_blob_sha256', 'arquivos_blob', ['blob_sha256'], ['sha256']
+            )
+
+    if 'emails_pendentes' not in existentes:
+        op.create_table('emails_pendentes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('destinatario', sa.String(length=255), nullable=False),
+        sa.Column('assunto', sa.String(length=255), nullable=False),
+        sa.Column('corpo', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('tentativas', sa.Integer(), nullable=False),
+        sa.Column('proxima_tentativa_em', sa.DateTime(), nullable=False),
+        sa.Column('ultimo_erro', sa.Text(), nullable=True),
+        sa.Column('criado_em', sa.DateTime(), nullable=False),
+        sa.Column('enviado_em', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(
+            'ix_emails_pendentes_status_proxima', 'emails_pendentes',
+            ['status', 'proxima_tentativa_em'], unique=False
+        )
+
+    if 'progresso_tarefas' not in existentes:
+        op.create_table('progresso_tarefas',
+        sa.Column('tarefa', sa.String(length=100), nullable=False),
+        sa.Column('ultimo_id', sa.Integer(), nullable=False),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('tarefa')
+        )
+
+
+def downgrade():
+    op.drop_table('progresso_tarefas')
+    op.drop_index('ix_emails_pendentes_status_proxima', table_name='emails_pendentes')
+    op.drop_table('emails_pendentes')
+    with op.batch_alter_table('documentos', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_documentos_blob_sha256', type_='foreignkey')
+        batch_op.drop_index('ix_documentos_blob_sha256')
+        batch_op.drop_column('blob_sha256')
+    op.drop_table('arquivos_blob')
@@ -0,0 +1,62 @@
+"""tabela password_resets no lugar das colunas de token em fornecedores
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    existentes = set(inspetor.get_table_names())
+
+    if 'password_resets' not in existentes:
+        op.create_table('password_resets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('fornecedor_id', sa.Integer(), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('used_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['fornecedor_id'], ['fornecedores.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(
+            'ix_password_resets_token_hash_expires_at', 'password_resets',
+            ['token_hash', 'expires_at'], unique=False
+        )
+        op.create_index(
+            'ix_password_resets_fornecedor_id', 'password_resets',
+            ['fornecedor_id'], unique=False
+        )
+
+    # Tokens pendentes nas colunas antigas são descartados: o banco só guarda o
+    # HMAC do token e o texto puro não pode ser convertido. Basta pedir outro.
+    colunas_fornecedores = {coluna['name'] for coluna in inspetor.get_columns('fornecedores')}
+    colunas_antigas = [
+        coluna for coluna in ('token_recuperacao', 'token_expira')
+        if coluna in colunas_fornecedores
+    ]
+    if colunas_antigas:
+        with op.batch_alter_table('fornecedores', schema=None) as batch_op:
+            for coluna in colunas_antigas:
+                batch_op.drop_column(coluna)
+
+
+def downgrade():
+    with op.batch_alter_table('fornecedores', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('token_expira', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('token_recuperacao', sa.String(length=6), nullable=True))
+    op.drop_index('ix_password_resets_fornecedor_id', table_name='password_resets')
+    op.drop_index('ix_password_resets_token_hash_expires_at', table_name='password_resets')
+    op.drop_table('password_resets')
@@ -0,0 +1,41 @@
+"""coluna email_normalizado indexada em fornecedores
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    colunas_fornecedores = {coluna['name'] for coluna in inspetor.get_columns('fornecedores')}
+
+    if 'email_normalizado' not in colunas_fornecedores:
+        op.add_column('fornecedores', sa.Column('email_normalizado', sa.String(length=100), nullable=True))
+    # Preenche também linhas deixadas em branco pelo _ensure_fornecedor_schema
+    op.execute(
+        'UPDATE fornecedores SET email_normalizado = lower(trim(email)) '
+        'WHERE email_normalizado IS NULL'
+    )
+
+    indices = {indice['name'] for indice in inspetor.get_indexes('fornecedores')}
+    with op.batch_alter_table('fornecedores', schema=None) as batch_op:
+        batch_op.alter_column('email_normalizado', existing_type=sa.String(length=100), nullable=False)
+        if 'ix_fornecedores_email_normalizado' not in indices:
+            batch_op.create_index('ix_fornecedores_email_normalizado', ['email_normalizado'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('fornecedores', schema=None) as batch_op:
+        batch_op.drop_index('ix_fornecedores_email_normalizado')
+        batch_op.drop_column('email_normalizado')
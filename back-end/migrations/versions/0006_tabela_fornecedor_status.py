@@ -0,0 +1,40 @@
+"""tabela fornecedor_status com o status materializado dos fornecedores
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    # A tabela começa vazia: é preenchida na primeira consulta ao dashboard ou
+    # com 'flask sincronizar-status-fornecedores'
+    if 'fornecedor_status' not in inspetor.get_table_names():
+        op.create_table('fornecedor_status',
+        sa.Column('fornecedor_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('nota_homologacao', sa.Float(), nullable=True),
+        sa.Column('iqf_final', sa.Float(), nullable=True),
+        sa.Column('total_documentos', sa.Integer(), nullable=False),
+        sa.Column('ultima_atividade', sa.DateTime(), nullable=True),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['fornecedor_id'], ['fornecedores.id'], ),
+        sa.PrimaryKeyConstraint('fornecedor_id')
+        )
+        op.create_index('ix_fornecedor_status_status', 'fornecedor_status', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_fornecedor_status_status', table_name='fornecedor_status')
+    op.drop_table('fornecedor_status')
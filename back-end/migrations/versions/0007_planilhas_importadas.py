@@ -0,0 +1,69 @@
+"""tabelas planilha_homologados e planilha_controle_qualidade
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    tabelas = inspetor.get_table_names()
+    # As tabelas começam vazias (a API continua lendo os arquivos Excel) até a
+    # primeira execução de 'flask import-planilhas'
+    if 'planilha_homologados' not in tabelas:
+        op.create_table('planilha_homologados',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('chave', sa.String(length=300), nullable=False),
+        sa.Column('linha', sa.Integer(), nullable=False),
+        sa.Column('codigo', sa.Integer(), nullable=True),
+        sa.Column('agente', sa.String(length=255), nullable=True),
+        sa.Column('agente_normalizado', sa.String(length=255), nullable=True),
+        sa.Column('nome_fantasia', sa.String(length=255), nullable=True),
+        sa.Column('nome_fantasia_normalizado', sa.String(length=255), nullable=True),
+        sa.Column('cnpj', sa.String(length=32), nullable=True),
+        sa.Column('cnpj_normalizado', sa.String(length=32), nullable=True),
+        sa.Column('aprovado', sa.String(length=10), nullable=True),
+        sa.Column('nota_homologacao', sa.Float(), nullable=True),
+        sa.Column('iqf', sa.Float(), nullable=True),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('chave')
+        )
+        op.create_index('ix_planilha_homologados_agente_normalizado', 'planilha_homologados',
+                        ['agente_normalizado'], unique=False)
+        op.create_index('ix_planilha_homologados_nome_fantasia_normalizado', 'planilha_homologados',
+                        ['nome_fantasia_normalizado'], unique=False)
+        op.create_index('ix_planilha_homologados_cnpj_normalizado', 'planilha_homologados',
+                        ['cnpj_normalizado'], unique=False)
+    if 'planilha_controle_qualidade' not in tabelas:
+        op.create_table('planilha_controle_qualidade',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('linha', sa.Integer(), nullable=False),
+        sa.Column('nome_agente', sa.String(length=255), nullable=True),
+        sa.Column('agente_normalizado', sa.String(length=255), nullable=False),
+        sa.Column('nota', sa.Float(), nullable=True),
+        sa.Column('observacao', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_planilha_controle_qualidade_agente_normalizado', 'planilha_controle_qualidade',
+                        ['agente_normalizado'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_planilha_controle_qualidade_agente_normalizado', table_name='planilha_controle_qualidade')
+    op.drop_table('planilha_controle_qualidade')
+    op.drop_index('ix_planilha_homologados_cnpj_normalizado', table_name='planilha_homologados')
+    op.drop_index('ix_planilha_homologados_nome_fantasia_normalizado', table_name='planilha_homologados')
+    op.drop_index('ix_planilha_homologados_agente_normalizado', table_name='planilha_homologados')
+    op.drop_table('planilha_homologados')
@@ -0,0 +1,31 @@
+"""coluna tentativas em password_resets
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    colunas = {coluna['name'] for coluna in inspetor.get_columns('password_resets')}
+    if 'tentativas' not in colunas:
+        op.add_column(
+            'password_resets',
+            sa.Column('tentativas', sa.Integer(), nullable=False, server_default='0')
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('password_resets', schema=None) as batch_op:
+        batch_op.drop_column('tentativas')
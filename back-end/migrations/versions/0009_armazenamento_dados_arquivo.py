@@ -0,0 +1,29 @@
+"""documentos.dados_arquivo sem compressão no PostgreSQL
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Com STORAGE EXTERNAL o bytea fica fora da linha e sem compressão, e o
+    # substr() do download em blocos lê apenas os trechos TOAST do bloco pedido.
+    # Vale para os valores gravados a partir daqui; os já comprimidos só mudam
+    # quando regravados (ou migrados para os blobs com 'flask migrar-blobs').
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE documentos ALTER COLUMN dados_arquivo SET STORAGE EXTERNAL')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE documentos ALTER COLUMN dados_arquivo SET STORAGE EXTENDED')
@@ -0,0 +1,28 @@
+"""coluna duracao_envio_ms em emails_pendentes
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspetor = sa.inspect(op.get_bind())
+    colunas = {coluna['name'] for coluna in inspetor.get_columns('emails_pendentes')}
+    if 'duracao_envio_ms' not in colunas:
+        op.add_column('emails_pendentes', sa.Column('duracao_envio_ms', sa.Float(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('emails_pendentes', schema=None) as batch_op:
+        batch_op.drop_column('duracao_envio_ms')
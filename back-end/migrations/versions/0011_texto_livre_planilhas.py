@@ -0,0 +1,55 @@
+"""colunas de texto livre das planilhas importadas sem limite de tamanho
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+# Colunas copiadas de células da planilha, com o tipo criado em 0007
+COLUNAS = {
+    'planilha_homologados': (
+        ('chave', sa.String(length=300)),
+        ('agente', sa.String(length=255)),
+        ('agente_normalizado', sa.String(length=255)),
+        ('nome_fantasia', sa.String(length=255)),
+        ('nome_fantasia_normalizado', sa.String(length=255)),
+        ('cnpj', sa.String(length=32)),
+        ('cnpj_normalizado', sa.String(length=32)),
+        ('aprovado', sa.String(length=10)),
+    ),
+    'planilha_controle_qualidade': (
+        ('nome_agente', sa.String(length=255)),
+        ('agente_normalizado', sa.String(length=255)),
+    ),
+}
+
+
+def upgrade():
+    # O SQLite não aplica o tamanho de VARCHAR: só é preciso alterar os demais bancos
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+    for tabela, colunas in COLUNAS.items():
+        with op.batch_alter_table(tabela, schema=None) as batch_op:
+            for nome, tipo in colunas:
+                batch_op.alter_column(nome, existing_type=tipo, type_=sa.Text())
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+    # Falha se já houver valores maiores que os tamanhos originais
+    for tabela, colunas in COLUNAS.items():
+        with op.batch_alter_table(tabela, schema=None) as batch_op:
+            for nome, tipo in colunas:
+                batch_op.alter_column(nome, existing_type=sa.Text(), type_=tipo)
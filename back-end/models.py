@@ -1,21 +1,27 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import deferred, validates
 from datetime import datetime
 
 db = SQLAlchemy()
 
 
+def normalizar_email(email):
+    """Forma canônica do e-mail usada nas buscas (sem espaços nas pontas, minúsculo)."""
+    return email.strip().lower() if email else email
+
+
 class Fornecedor(db.Model):
     __tablename__ = 'fornecedores'
 
     id = db.Column(db.Integer, primary_key=True)
     nome = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(100), unique=True, nullable=False)
+    # Mantido por @validates('email'); o login busca por esta coluna indexada
+    # em vez de email ILIKE, que não usa índice no PostgreSQL
+    email_normalizado = db.Column(db.String(100), nullable=False, index=True)
     cnpj = db.Column(db.String(18), unique=True, nullable=False)
     senha = db.Column(db.String(256), nullable=False)
 
-    token_recuperacao = db.Column(db.String(6), nullable=True)
-    token_expira = db.Column(db.DateTime, nullable=True)
-
     categoria = db.Column(db.String(100), nullable=True)
     data_cadastro = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
@@ -37,6 +43,18 @@ class Fornecedor(db.Model):
         uselist=False,
         cascade='all, delete-orphan'
     )
+    redefinicoes_senha = db.relationship(
+        'RedefinicaoSenha',
+        backref='fornecedor',
+        lazy=True,
+        cascade='all, delete-orphan'
+    )
+    status_materializado = db.relationship(
+        'FornecedorStatus',
+        backref='fornecedor',
+        uselist=False,
+        cascade='all, delete-orphan'
+    )
 
     def __init__(self, nome, email, cnpj, senha, **kwargs):
         super().__init__(**kwargs)
@@ -45,6 +63,11 @@ class Fornecedor(db.Model):
         self.cnpj = cnpj
         self.senha = senha
 
+    @validates('email')
+    def _normalizar_email(self, chave, email):
+        self.email_normalizado = normalizar_email(email)
+        return email
+
 
 class Documento(db.Model):
     __tablename__ = 'documentos'
@@ -54,11 +77,26 @@ class Documento(db.Model):
     categoria = db.Column(db.String(50), nullable=False)
     data_upload = db.Column(db.DateTime, default=datetime.utcnow)
     mime_type = db.Column(db.String(255), nullable=True)
-    dados_arquivo = db.Column(db.LargeBinary, nullable=True)
+    # Conteúdo binário carregado sob demanda: consultas de Documento não trazem
+    # os bytes do arquivo a menos que o atributo seja acessado ou use undefer()
+    dados_arquivo = deferred(db.Column(db.LargeBinary, nullable=True))
+    # Conteúdo no armazenamento endereçado por conteúdo (ver ArquivoBlob)
+    blob_sha256 = db.Column(db.String(64), db.ForeignKey('arquivos_blob.sha256'), nullable=True, index=True)
 
     fornecedor_id = db.Column(db.Integer, db.ForeignKey('fornecedores.id'), nullable=False)
 
 
+class ArquivoBlob(db.Model):
+    __tablename__ = 'arquivos_blob'
+
+    # Hash SHA-256 do conteúdo, que também define o caminho do arquivo no disco
+    sha256 = db.Column(db.String(64), primary_key=True)
+    tamanho = db.Column(db.BigInteger, nullable=False)
+    # Quantidade de documentos que apontam para este conteúdo
+    referencias = db.Column(db.Integer, default=0, nullable=False)
+    criado_em = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
 class Homologacao(db.Model):
     __tablename__ = 'homologacoes'
 
@@ -87,3 +125,103 @@ class NotaFornecedor(db.Model):
     nota_referencia = db.Column(db.Float, nullable=True)
     email_enviado = db.Column(db.Boolean, default=False, nullable=False)
     decisao_atualizada_em = db.Column(db.DateTime, nullable=True)
+
+
+class FornecedorStatus(db.Model):
+    """Projeção do status calculado de cada fornecedor, mantida incrementalmente."""
+    __tablename__ = 'fornecedor_status'
+
+    fornecedor_id = db.Column(db.Integer, db.ForeignKey('fornecedores.id'), primary_key=True)
+    # APROVADO, REPROVADO, EM_ANALISE ou A CADASTRAR (ver _calcular_situacao_fornecedor)
+    status = db.Column(db.String(20), nullable=False, index=True)
+    nota_homologacao = db.Column(db.Float, nullable=True)
+    iqf_final = db.Column(db.Float, nullable=True)
+    total_documentos = db.Column(db.Integer, default=0, nullable=False)
+    ultima_atividade = db.Column(db.DateTime, nullable=True)
+    atualizado_em = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+class HomologadoPlanilha(db.Model):
+    """Linha importada de fornecedores_homologados.xlsx (ver 'flask import-planilhas')."""
+    __tablename__ = 'planilha_homologados'
+
+    id = db.Column(db.Integer, primary_key=True)
+    # Código do agente ou, sem código, agente normalizado + CNPJ normalizado.
+    # As colunas de texto copiam células livres da planilha, então não têm
+    # limite de tamanho (o PostgreSQL rejeitaria valores maiores que String(n))
+    chave = db.Column(db.Text, unique=True, nullable=False)
+    # Posição na planilha: a busca por nome devolve a primeira linha, como no Excel
+    linha = db.Column(db.Integer, nullable=False)
+    codigo = db.Column(db.Integer, nullable=True)
+    agente = db.Column(db.Text, nullable=True)
+    agente_normalizado = db.Column(db.Text, nullable=True, index=True)
+    nome_fantasia = db.Column(db.Text, nullable=True)
+    nome_fantasia_normalizado = db.Column(db.Text, nullable=True, index=True)
+    cnpj = db.Column(db.Text, nullable=True)
+    cnpj_normalizado = db.Column(db.Text, nullable=True, index=True)
+    aprovado = db.Column(db.Text, nullable=True)
+    nota_homologacao = db.Column(db.Float, nullable=True)
+    iqf = db.Column(db.Float, nullable=True)
+    atualizado_em = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ControleQualidadePlanilha(db.Model):
+    """Linha importada de 'atendimento controle_qualidade.xlsx' (uma avaliação IQF)."""
+    __tablename__ = 'planilha_controle_qualidade'
+
+    id = db.Column(db.Integer, primary_key=True)
+    linha = db.Column(db.Integer, nullable=False)
+    nome_agente = db.Column(db.Text, nullable=True)
+    agente_normalizado = db.Column(db.Text, nullable=False, index=True)
+    nota = db.Column(db.Float, nullable=True)
+    observacao = db.Column(db.Text, nullable=True)
+
+
+class EmailPendente(db.Model):
+    __tablename__ = 'emails_pendentes'
+    __table_args__ = (
+        db.Index('ix_emails_pendentes_status_proxima', 'status', 'proxima_tentativa_em'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    destinatario = db.Column(db.String(255), nullable=False)
+    assunto = db.Column(db.String(255), nullable=False)
+    corpo = db.Column(db.Text, nullable=False)
+    # PENDENTE, ENVIANDO, ENVIADO ou FALHOU
+    status = db.Column(db.String(20), default='PENDENTE', nullable=False)
+    tentativas = db.Column(db.Integer, default=0, nullable=False)
+    # Próximo envio permitido; enquanto ENVIANDO, marca o fim da reserva do worker
+    proxima_tentativa_em = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    ultimo_erro = db.Column(db.Text, nullable=True)
+    criado_em = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    enviado_em = db.Column(db.DateTime, nullable=True)
+    # Duração, em ms, da última tentativa de envio (conversa SMTP)
+    duracao_envio_ms = db.Column(db.Float, nullable=True)
+
+
+class ProgressoTarefa(db.Model):
+    __tablename__ = 'progresso_tarefas'
+
+    # Nome da tarefa em lote (ex.: 'backfill-documents')
+    tarefa = db.Column(db.String(100), primary_key=True)
+    # Maior id já processado; a próxima execução continua a partir dele
+    ultimo_id = db.Column(db.Integer, default=0, nullable=False)
+    atualizado_em = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class RedefinicaoSenha(db.Model):
+    __tablename__ = 'password_resets'
+    __table_args__ = (
+        db.Index('ix_password_resets_token_hash_expires_at', 'token_hash', 'expires_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    fornecedor_id = db.Column(db.Integer, db.ForeignKey('fornecedores.id'), nullable=False, index=True)
+    # HMAC-SHA256 do token enviado por e-mail; o token em si nunca é gravado
+    token_hash = db.Column(db.String(64), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    # Preenchido quando o token é usado para redefinir a senha (uso único)
+    used_at = db.Column(db.DateTime, nullable=True)
+    # Tentativas com token errado para o e-mail; no limite o token é descartado
+    tentativas = db.Column(db.Integer, default=0, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,291 @@
+"""
+Hash de senhas dos fornecedores com algoritmo e custo configuráveis.
+
+As funções daqui não dependem do Flask nem do banco: recebem o método no
+formato do Werkzeug ('pbkdf2:sha256:<iterações>' ou 'scrypt:<n>:<r>:<p>'),
+montado por metodo_hash a partir da configuração (Config.SENHA_HASH_*).
+
+ExecutorSenhas executa essas funções em um pool limitado de processos, fora da
+thread da requisição, e recusa trabalho quando a fila está cheia.
+"""
+import collections
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturoTimeoutError
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+ALGORITMOS_HASH = ('pbkdf2', 'scrypt')
+
+
+def metodo_hash(algoritmo, iteracoes=None, scrypt_n=None, scrypt_r=8, scrypt_p=1):
+    """
+    Monta a string de método aceita por generate_password_hash.
+
+    Args:
+        algoritmo: 'pbkdf2' ou 'scrypt'
+        iteracoes: Número de iterações do PBKDF2-SHA256
+        scrypt_n: Fator de custo (CPU/memória) do scrypt, potência de 2
+        scrypt_r: Tamanho de bloco do scrypt
+        scrypt_p: Paralelismo do scrypt
+
+    Returns:
+        Método no formato do Werkzeug, por exemplo 'pbkdf2:sha256:600000'
+
+    Raises:
+        ValueError: Se o algoritmo ou os parâmetros forem inválidos
+    """
+    algoritmo = (algoritmo or '').strip().lower()
+    if algoritmo == 'pbkdf2':
+        if not iteracoes or int(iteracoes) < 1:
+            raise ValueError('PBKDF2 exige um número de iterações positivo.')
+        return f'pbkdf2:sha256:{int(iteracoes)}'
+    if algoritmo == 'scrypt':
+        n, r, p = int(scrypt_n or 0), int(scrypt_r), int(scrypt_p)
+        if n < 2 or n & (n - 1):
+            raise ValueError('O parâmetro n do scrypt deve ser uma potência de 2 maior que 1.')
+        if r < 1 or p < 1:
+            raise ValueError('Os parâmetros r e p do scrypt devem ser positivos.')
+        return f'scrypt:{n}:{r}:{p}'
+    raise ValueError(f"Algoritmo de hash de senha inválido: '{algoritmo}'. Use {' ou '.join(ALGORITMOS_HASH)}.")
+
+
+def gerar_hash_senha(senha, metodo):
+    """Gera o hash de uma senha com o método informado (ver metodo_hash)."""
+    return generate_password_hash(senha, method=metodo)
+
+
+def verificar_senha(hash_armazenado, senha):
+    """Compara a senha com o hash armazenado, em tempo constante."""
+    return check_password_hash(hash_armazenado, senha)
+
+
+def precisa_rehash(hash_armazenado, metodo):
+    """
+    Indica se um hash foi gerado com parâmetros diferentes dos atuais.
+
+    O Werkzeug grava o método no início do hash ('pbkdf2:sha256:600000$sal$...'),
+    então basta comparar esse prefixo com o método configurado. Hashes mais
+    fracos e mais caros que o configurado são ambos regravados.
+
+    Args:
+        hash_armazenado: Hash gravado no banco
+        metodo: Método configurado (ver metodo_hash)
+
+    Returns:
+        True se o hash deve ser regerado no próximo login
+    """
+    if not hash_armazenado or '$' not in hash_armazenado:
+        return True
+    return hash_armazenado.split('$', 1)[0] != metodo
+
+
+def medir_hash(metodo, repeticoes=3):
+    """
+    Mede o tempo, em segundos, de um hash com o método informado.
+
+    Args:
+        metodo: Método no formato do Werkzeug
+        repeticoes: Quantidade de hashes medidos (usa a menor medição)
+
+    Returns:
+        Tempo do hash em segundos
+    """
+    tempos = []
+    for _ in range(max(1, repeticoes)):
+        inicio = time.perf_counter()
+        generate_password_hash('senha-de-calibracao', method=metodo)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def calibrar_custo(algoritmo, alvo_ms, scrypt_r=8, scrypt_p=1, repeticoes=3):
+    """
+    Escolhe o custo do algoritmo para que um hash leve cerca de alvo_ms neste host.
+
+    Para o PBKDF2 o tempo é linear nas iterações: mede uma amostra e escala,
+    arredondando para milhares. Para o scrypt dobra n (a partir de 2**12) e fica
+    com o maior valor que não passa do alvo.
+
+    Args:
+        algoritmo: 'pbkdf2' ou 'scrypt'
+        alvo_ms: Latência desejada por hash, em milissegundos
+        scrypt_r: Tamanho de bloco do scrypt
+        scrypt_p: Paralelismo do scrypt
+        repeticoes: Repetições por medição
+
+    Returns:
+        Tupla (parametros, metodo, tempo_ms): parametros é um dicionário com
+        as chaves de configuração sem o prefixo SENHA_ (pbkdf2_iteracoes
+        ou scrypt_n/scrypt_r/scrypt_p)
+    """
+    alvo = alvo_ms / 1000.0
+    algoritmo = (algoritmo or '').strip().lower()
+    if algoritmo == 'pbkdf2':
+        amostra = 100_000
+        tempo = medir_hash(metodo_hash('pbkdf2', amostra), repeticoes)
+        iteracoes = max(1000, int(round(amostra * alvo / tempo, -3)))
+        metodo = metodo_hash('pbkdf2', iteracoes)
+        return {'pbkdf2_iteracoes': iteracoes}, metodo, medir_hash(metodo, repeticoes) * 1000
+    if algoritmo == 'scrypt':
+        n = 2 ** 12
+        metodo = metodo_hash('scrypt', scrypt_n=n, scrypt_r=scrypt_r, scrypt_p=scrypt_p)
+        tempo = medir_hash(metodo, repeticoes)
+        while tempo * 2 <= alvo and n < 2 ** 20:
+            proximo = metodo_hash('scrypt', scrypt_n=n * 2, scrypt_r=scrypt_r, scrypt_p=scrypt_p)
+            tempo_proximo = medir_hash(proximo, repeticoes)
+            if tempo_proximo > alvo:
+                break
+            n, metodo, tempo = n * 2, proximo, tempo_proximo
+        parametros = {'scrypt_n': n, 'scrypt_r': scrypt_r, 'scrypt_p': scrypt_p}
+        return parametros, metodo, tempo * 1000
+    # Reaproveita a mensagem de erro de metodo_hash
+    metodo_hash(algoritmo)
+
+
+class SobrecargaSenhasError(RuntimeError):
+    """
+    O pool de hash de senhas não aceitou a operação (fila cheia ou espera esgotada).
+
+    Attributes:
+        retry_after: Segundos sugeridos ao cliente antes de tentar novamente
+    """
+
+    def __init__(self, mensagem, retry_after):
+        super().__init__(mensagem)
+        self.retry_after = retry_after
+
+
+class ExecutorSenhas:
+    """
+    Pool limitado de processos para gerar e verificar hashes de senha.
+
+    O hash é CPU puro; em processos separados ele não disputa o GIL com as
+    demais requisições do worker. No máximo `processos + fila` operações ficam
+    em andamento por processo web: além disso a chamada falha imediatamente com
+    SobrecargaSenhasError, que a API traduz em 503 com Retry-After.
+
+    Com processos=0 as operações rodam na própria thread (desenvolvimento),
+    mantendo o limite de concorrência e as métricas.
+
+    A thread que chama espera o resultado, então o limite só tem efeito com
+    mais threads por processo do que `processos + fila` (gunicorn com
+    --worker-class gthread, ver Procfile e Config.SENHA_POOL_FILA). Com um
+    worker sync a requisição seguinte nunca chega a encontrar a fila cheia.
+
+    O pool é criado na primeira chamada de cada processo (depois do fork dos
+    workers do gunicorn) com o contexto 'spawn', para que os processos filhos
+    não herdem threads e conexões do worker. Com 'spawn' os filhos importam o
+    módulo principal: sob o gunicorn isso é barato, mas com 'python app.py' cada
+    filho reimporta o app inteiro (use SENHA_POOL_PROCESSOS=0 nesse caso).
+    """
+
+    def __init__(self, processos=2, fila=2, espera_maxima=10.0, retry_after=2, amostras=500):
+        self.processos = max(0, int(processos))
+        self.fila = max(0, int(fila))
+        self.espera_maxima = float(espera_maxima)
+        self.retry_after = int(retry_after)
+        self._vagas = threading.BoundedSemaphore(max(1, self.processos) + self.fila)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pid = None
+        self._latencias = collections.deque(maxlen=amostras)
+        self._estatisticas = {
+            'concluidas': 0, 'rejeitadas': 0, 'esgotadas': 0, 'em_andamento': 0, 'latencia_max_ms': 0.0,
+        }
+
+    def _obter_pool(self):
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processos,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+                self._pid = os.getpid()
+            return self._pool
+
+    def _executar(self, funcao, *argumentos):
+        if not self._vagas.acquire(blocking=False):
+            with self._lock:
+                self._estatisticas['rejeitadas'] += 1
+            raise SobrecargaSenhasError('Fila de hash de senhas cheia', self.retry_after)
+        with self._lock:
+            self._estatisticas['em_andamento'] += 1
+        inicio = time.perf_counter()
+
+        def liberar(_futuro=None):
+            with self._lock:
+                self._estatisticas['em_andamento'] -= 1
+            self._vagas.release()
+
+        if not self.processos:
+            try:
+                resultado = funcao(*argumentos)
+            finally:
+                liberar()
+        else:
+            try:
+                futuro = self._obter_pool().submit(funcao, *argumentos)
+            except Exception:
+                liberar()
+                raise
+            # A vaga só é devolvida quando o processo termina, mesmo que a
+            # requisição desista antes (espera esgotada)
+            futuro.add_done_callback(liberar)
+            try:
+                resultado = futuro.result(timeout=self.espera_maxima)
+            except FuturoTimeoutError:
+                with self._lock:
+                    self._estatisticas['esgotadas'] += 1
+                raise SobrecargaSenhasError('Tempo de espera do hash de senha esgotado', self.retry_after) from None
+        latencia_ms = (time.perf_counter() - inicio) * 1000
+        with self._lock:
+            self._estatisticas['concluidas'] += 1
+            self._estatisticas['latencia_max_ms'] = max(self._estatisticas['latencia_max_ms'], latencia_ms)
+            self._latencias.append(latencia_ms)
+        return resultado
+
+    def gerar_hash(self, senha, metodo):
+        """Executa gerar_hash_senha no pool."""
+        return self._executar(gerar_hash_senha, senha, metodo)
+
+    def verificar(self, hash_armazenado, senha):
+        """Executa verificar_senha no pool."""
+        return self._executar(verificar_senha, hash_armazenado, senha)
+
+    def estatisticas(self):
+        """
+        Contadores e latências (espera na fila + execução) deste processo.
+
+        Returns:
+            Dicionário com capacidade, operações concluídas, rejeitadas e
+            esgotadas, operações em andamento e percentis de latência em ms
+        """
+        with self._lock:
+            dados = dict(self._estatisticas)
+            latencias = sorted(self._latencias)
+
+        def percentil(fracao):
+            if not latencias:
+                return None
+            return round(latencias[min(len(latencias) - 1, int(fracao * len(latencias)))], 2)
+
+        dados.update(
+            processos=self.processos,
+            capacidade=max(1, self.processos) + self.fila,
+            latencia_p50_ms=percentil(0.50),
+            latencia_p95_ms=percentil(0.95),
+            latencia_max_ms=round(dados['latencia_max_ms'], 2),
+        )
+        return dados
+
+    def encerrar(self):
+        """Encerra os processos do pool (se tiverem sido criados)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
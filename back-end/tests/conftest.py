@@ -0,0 +1,60 @@
+"""
+Configuração comum dos testes do back-end.
+
+O app é importado com um banco SQLite em um diretório temporário (em memória
+não serve: o SQLite usa StaticPool, que recusa o pool_size/max_overflow de
+Config.SQLALCHEMY_ENGINE_OPTIONS), sem snapshots das planilhas
+(que seriam gravados ao lado dos .xlsx do projeto), com o hash de senhas na
+própria thread e com a fila de e-mails marcada como consumida por um worker
+externo (os testes chamam processar_fila_emails diretamente). Cada teste
+recebe um schema recém-criado.
+
+Uso (a partir de back-end/):
+    python -m pytest -q
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_DIRETORIO_BANCO = tempfile.mkdtemp(prefix='testes_portal_')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_DIRETORIO_BANCO, 'testes.db')}"
+os.environ['SECRET_KEY'] = 'chave-dos-testes-com-mais-de-32-bytes'
+os.environ['INICIALIZACAO_RAPIDA'] = 'false'
+os.environ['PLANILHAS_SNAPSHOT'] = 'false'
+os.environ['SENHA_POOL_PROCESSOS'] = '0'
+os.environ['EMAIL_FILA_WORKER_THREAD'] = 'false'
+os.environ['EMAIL_FILA_WORKER_EXTERNO'] = 'true'
+
+import pytest  # noqa: E402
+from flask_jwt_extended import create_access_token  # noqa: E402
+
+import app as portal  # noqa: E402
+
+
+@pytest.fixture
+def app_teste():
+    """App com as tabelas recriadas e a sincronização de status zerada."""
+    with portal.app.app_context():
+        portal.db.drop_all()
+        portal.db.create_all()
+        # fornecedor_status foi recriada vazia: a próxima consulta ressincroniza
+        portal._marcar_status_sincronizado(None)
+        yield portal.app
+        portal.db.session.remove()
+        portal.db.drop_all()
+
+
+@pytest.fixture
+def cliente(app_teste):
+    return app_teste.test_client()
+
+
+@pytest.fixture
+def cabecalhos_admin(app_teste):
+    token = create_access_token(
+        identity=sorted(portal.ADMIN_ALLOWED_EMAILS)[0],
+        additional_claims={'role': 'admin'},
+    )
+    return {'Authorization': f'Bearer {token}'}
@@ -0,0 +1,172 @@
+"""
+Armazenamento de documentos endereçado por conteúdo (uploads/blobs).
+
+Cobre a contagem de referências entre uploads, exclusões e regravações, a
+regravação de um arquivo removido enquanto outro upload do mesmo conteúdo
+estava em andamento, a limpeza de arquivos sem registro e o checkpoint do
+backfill-documents diante de documentos sem arquivo.
+"""
+import io
+import os
+import time
+
+import pytest
+
+import app as portal
+
+PDF_A = b'%PDF-1.4 conteudo A'
+PDF_B = b'%PDF-1.4 conteudo B'
+
+
+@pytest.fixture
+def pasta_blobs(app_teste, tmp_path, monkeypatch):
+    monkeypatch.setattr(portal, 'UPLOAD_FOLDER', str(tmp_path))
+    monkeypatch.setattr(portal, 'BLOB_FOLDER', str(tmp_path / 'blobs'))
+    return tmp_path / 'blobs'
+
+
+def _cadastrar_fornecedor(posicao):
+    fornecedor = portal.Fornecedor(
+        nome=f'Fornecedor {posicao}',
+        email=f'fornecedor{posicao}@exemplo.com',
+        cnpj=f'{posicao:014d}',
+        senha='hash',
+        categoria='Material',
+    )
+    portal.db.session.add(fornecedor)
+    portal.db.session.commit()
+    return fornecedor.id
+
+
+def _enviar(cliente, fornecedor_id, *arquivos):
+    return cliente.post('/api/envio-documento', data={
+        'fornecedor_id': str(fornecedor_id),
+        'categoria': 'Material',
+        'arquivos': [(io.BytesIO(conteudo), nome) for nome, conteudo in arquivos],
+    }, content_type='multipart/form-data')
+
+
+def _referencias():
+    portal.db.session.expire_all()
+    return {blob.sha256: blob.referencias for blob in portal.ArquivoBlob.query}
+
+
+def _arquivos(pasta):
+    if not pasta.exists():
+        return []
+    return sorted(caminho.name for caminho in pasta.rglob('*') if caminho.is_file())
+
+
+def _sha(conteudo):
+    return portal.hashlib.sha256(conteudo).hexdigest()
+
+
+def test_referencias_entre_uploads_e_exclusoes(cliente, cabecalhos_admin, pasta_blobs):
+    primeiro, segundo = _cadastrar_fornecedor(1), _cadastrar_fornecedor(2)
+    assert _enviar(cliente, primeiro, ('a.pdf', PDF_A), ('copia.pdf', PDF_A)).status_code == 200
+    assert _enviar(cliente, segundo, ('a.pdf', PDF_A)).status_code == 200
+    assert _referencias() == {_sha(PDF_A): 3}
+    assert _arquivos(pasta_blobs) == [_sha(PDF_A)]
+
+    assert cliente.delete(f'/api/admin/fornecedores/{primeiro}', headers=cabecalhos_admin).status_code == 200
+    assert _referencias() == {_sha(PDF_A): 1}
+    assert _arquivos(pasta_blobs) == [_sha(PDF_A)]
+
+    assert cliente.delete(f'/api/admin/fornecedores/{segundo}', headers=cabecalhos_admin).status_code == 200
+    assert _referencias() == {}
+    assert _arquivos(pasta_blobs) == []
+
+
+def test_upload_deduplicado_regrava_arquivo_ausente(cliente, pasta_blobs):
+    fornecedor = _cadastrar_fornecedor(1)
+    assert _enviar(cliente, fornecedor, ('a.pdf', PDF_A)).status_code == 200
+    # Arquivo apagado por uma remoção concluída antes do registro da referência
+    os.remove(portal._caminho_blob(_sha(PDF_A)))
+
+    assert _enviar(cliente, fornecedor, ('a.pdf', PDF_A)).status_code == 200
+    assert _referencias() == {_sha(PDF_A): 2}
+    with open(portal._caminho_blob(_sha(PDF_A)), 'rb') as arquivo:
+        assert arquivo.read() == PDF_A
+
+
+def test_upload_recusado_nao_deixa_arquivos(cliente, pasta_blobs):
+    fornecedor = _cadastrar_fornecedor(1)
+    resposta = _enviar(cliente, fornecedor, ('a.pdf', PDF_A), ('b.pdf', b'sem assinatura'))
+    assert resposta.status_code == 400
+    assert _referencias() == {}
+    assert _arquivos(pasta_blobs) == []
+
+
+def test_regravar_documento_libera_blob_anterior(app_teste, pasta_blobs):
+    fornecedor_id = _cadastrar_fornecedor(1)
+    documento = portal.Documento(
+        nome_documento='a.pdf', categoria='Material',
+        mime_type='application/pdf', fornecedor_id=fornecedor_id,
+    )
+    portal.db.session.add(documento)
+    assert portal._armazenar_documento_em_blob(documento, PDF_A)
+    portal.db.session.commit()
+    assert _referencias() == {_sha(PDF_A): 1}
+
+    blob_anterior = documento.blob_sha256
+    assert portal._armazenar_documento_em_blob(documento, PDF_B)
+    portal.db.session.commit()
+    assert _referencias() == {_sha(PDF_A): 0, _sha(PDF_B): 1}
+
+    portal._remover_arquivos_blob([blob_anterior])
+    assert _referencias() == {_sha(PDF_B): 1}
+    assert _arquivos(pasta_blobs) == [_sha(PDF_B)]
+
+
+def test_limpar_blobs_respeita_idade_minima(cliente, pasta_blobs):
+    fornecedor = _cadastrar_fornecedor(1)
+    assert _enviar(cliente, fornecedor, ('a.pdf', PDF_A)).status_code == 200
+    antigo = time.time() - 3600
+    for conteudo, idade in ((PDF_B, antigo), (b'recente', None)):
+        caminho = portal._caminho_blob(_sha(conteudo))
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(conteudo)
+        if idade:
+            os.utime(caminho, (idade, idade))
+    temporario = pasta_blobs / 'abandonado.tmp'
+    temporario.write_bytes(b'parcial')
+    os.utime(temporario, (antigo, antigo))
+    os.utime(portal._caminho_blob(_sha(PDF_A)), (antigo, antigo))
+
+    resultado = cliente.application.test_cli_runner().invoke(args=['limpar-blobs', '--idade-minima', '30'])
+    assert resultado.exit_code == 0, resultado.output
+    assert _arquivos(pasta_blobs) == sorted([_sha(PDF_A), _sha(b'recente')])
+    assert _referencias() == {_sha(PDF_A): 1}
+
+
+def test_backfill_nao_avanca_checkpoint_alem_de_documento_sem_arquivo(cliente, pasta_blobs, tmp_path):
+    fornecedor_id = _cadastrar_fornecedor(1)
+    ids = []
+    for nome in ('backfill-1.pdf', 'backfill-2.pdf', 'backfill-3.pdf'):
+        documento = portal.Documento(nome_documento=nome, categoria='Material', fornecedor_id=fornecedor_id)
+        portal.db.session.add(documento)
+        portal.db.session.flush()
+        ids.append(documento.id)
+    portal.db.session.commit()
+    pasta_fornecedor = tmp_path / str(fornecedor_id)
+    pasta_fornecedor.mkdir()
+    (pasta_fornecedor / 'backfill-1.pdf').write_bytes(PDF_A)
+    (pasta_fornecedor / 'backfill-3.pdf').write_bytes(PDF_B)
+    runner = cliente.application.test_cli_runner()
+
+    resultado = runner.invoke(args=['backfill-documents', '--lote', '1'])
+    assert resultado.exit_code == 0, resultado.output
+    assert f'continuam sem conteúdo e serão tentados de novo na próxima execução: {ids[1]}' in resultado.output
+    portal.db.session.expire_all()
+    assert portal.db.session.get(portal.ProgressoTarefa, 'backfill-documents').ultimo_id == ids[0]
+    assert _referencias() == {_sha(PDF_A): 1, _sha(PDF_B): 1}
+
+    (pasta_fornecedor / 'backfill-2.pdf').write_bytes(b'%PDF-1.4 conteudo C')
+    resultado = runner.invoke(args=['backfill-documents', '--lote', '1'])
+    assert resultado.exit_code == 0, resultado.output
+    assert 'Backfill concluído: 1 documentos recuperados.' in resultado.output
+    assert 'continuam sem conteúdo' not in resultado.output
+    portal.db.session.expire_all()
+    assert portal.db.session.get(portal.ProgressoTarefa, 'backfill-documents').ultimo_id == ids[1]
+    assert portal.db.session.get(portal.Documento, ids[1]).blob_sha256 == _sha(b'%PDF-1.4 conteudo C')
@@ -0,0 +1,96 @@
+"""
+Quantidade de consultas SQL das telas administrativas.
+
+A listagem e o dashboard devem emitir um número fixo de comandos, qualquer que
+seja a quantidade de fornecedores (sem o padrão 1 + 2N de carregar a nota e os
+documentos de cada fornecedor), e nunca trazer o conteúdo binário dos
+documentos (dados_arquivo).
+"""
+import contextlib
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+import app as portal
+
+# (SELECTs da primeira chamada, comandos das chamadas seguintes) por tela.
+# Na primeira chamada do dashboard fornecedor_status é gravada (INSERTs por
+# fornecedor); as consultas de leitura continuam fixas.
+CONSULTAS_LISTAGEM = (3, 3)
+CONSULTAS_LISTAGEM_PAGINADA = (5, 5)
+CONSULTAS_DASHBOARD = (5, 2)
+
+
+def _cadastrar_fornecedores(quantidade):
+    for posicao in range(quantidade):
+        fornecedor = portal.Fornecedor(
+            nome=f'Fornecedor {posicao:03d}',
+            email=f'fornecedor{posicao}@exemplo.com',
+            cnpj=f'{posicao:014d}',
+            senha='hash',
+            categoria='Material' if posicao % 2 else 'Servico',
+        )
+        fornecedor.data_cadastro = datetime(2025, 1, 1) + timedelta(days=posicao)
+        fornecedor.nota_admin = portal.NotaFornecedor(nota_homologacao=70.0 + posicao % 30)
+        fornecedor.documentos = [
+            portal.Documento(
+                nome_documento=f'documento_{indice}.pdf',
+                categoria='Material',
+                mime_type='application/pdf',
+                dados_arquivo=b'%PDF-1.4 conteudo',
+            )
+            for indice in range(3)
+        ]
+        portal.db.session.add(fornecedor)
+    portal.db.session.commit()
+
+
+@contextlib.contextmanager
+def _capturar_comandos():
+    comandos = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        comandos.append(statement)
+
+    motor = portal.db.engine
+    event.listen(motor, 'before_cursor_execute', registrar)
+    try:
+        yield comandos
+    finally:
+        event.remove(motor, 'before_cursor_execute', registrar)
+
+
+def _selects(comandos):
+    return [comando for comando in comandos if comando.lstrip().upper().startswith('SELECT')]
+
+
+def _medir_requisicao(cliente, url, cabecalhos):
+    """
+    Comandos da primeira chamada e da chamada seguinte à mesma URL.
+    
+    A primeira chamada carrega as planilhas e sincroniza fornecedor_status;
+    a segunda já encontra o processo aquecido.
+    """
+    respostas = []
+    medidas = []
+    for _ in range(2):
+        with _capturar_comandos() as comandos:
+            respostas.append(cliente.get(url, headers=cabecalhos))
+        medidas.append(comandos)
+    assert [resposta.status_code for resposta in respostas] == [200, 200]
+    return medidas
+
+
+@pytest.mark.parametrize('quantidade', [3, 40])
+@pytest.mark.parametrize('url, esperado', [
+    ('/api/admin/fornecedores', CONSULTAS_LISTAGEM),
+    ('/api/admin/fornecedores?limit=10', CONSULTAS_LISTAGEM_PAGINADA),
+    ('/api/admin/dashboard', CONSULTAS_DASHBOARD),
+])
+def test_consultas_administrativas_nao_crescem_com_fornecedores(cliente, cabecalhos_admin, quantidade, url, esperado):
+    _cadastrar_fornecedores(quantidade)
+    primeira, seguinte = _medir_requisicao(cliente, url, cabecalhos_admin)
+    assert (len(_selects(primeira)), len(seguinte)) == esperado, (_selects(primeira), seguinte)
+    for comandos in (primeira, seguinte):
+        assert not [comando for comando in _selects(comandos) if 'dados_arquivo' in comando]
@@ -0,0 +1,98 @@
+"""
+Download de documentos guardados em documentos.dados_arquivo.
+
+O conteúdo é transmitido em blocos de DOCUMENTO_TAMANHO_BLOCO, com suporte a
+HTTP Range, e nenhuma conexão do pool fica presa enquanto o cliente consome
+a resposta. O índice de arquivos das pastas antigas é reconstruído fora do
+lock que o protege.
+"""
+import pytest
+
+import app as portal
+
+CONTEUDO = bytes(range(256)) * 40  # 10 KiB
+
+
+@pytest.fixture
+def documento_no_banco(app_teste, monkeypatch):
+    monkeypatch.setattr(portal, 'DOCUMENTO_TAMANHO_BLOCO', 1024)
+    fornecedor = portal.Fornecedor(
+        nome='Fornecedor 1',
+        email='fornecedor1@exemplo.com',
+        cnpj='00000000000001',
+        senha='hash',
+        categoria='Material',
+    )
+    portal.db.session.add(fornecedor)
+    portal.db.session.flush()
+    documento = portal.Documento(
+        nome_documento='so-no-banco.pdf',
+        categoria='Material',
+        mime_type='application/pdf',
+        fornecedor_id=fornecedor.id,
+        dados_arquivo=CONTEUDO,
+    )
+    portal.db.session.add(documento)
+    portal.db.session.commit()
+    return documento.id
+
+
+def _baixar(cliente, cabecalhos, documento_id, **extra):
+    return cliente.get(
+        f'/api/admin/documentos/{documento_id}/download',
+        headers={**cabecalhos, **extra},
+        buffered=False,
+    )
+
+
+def test_download_completo_e_parcial(cliente, cabecalhos_admin, documento_no_banco):
+    resposta = _baixar(cliente, cabecalhos_admin, documento_no_banco)
+    assert resposta.status_code == 200
+    assert resposta.headers['Accept-Ranges'] == 'bytes'
+    assert resposta.get_data() == CONTEUDO
+
+    resposta = _baixar(cliente, cabecalhos_admin, documento_no_banco, Range='bytes=1000-3099')
+    assert resposta.status_code == 206
+    assert resposta.headers['Content-Range'] == f'bytes 1000-3099/{len(CONTEUDO)}'
+    assert resposta.get_data() == CONTEUDO[1000:3100]
+
+    resposta = _baixar(cliente, cabecalhos_admin, documento_no_banco, Range=f'bytes={len(CONTEUDO)}-')
+    assert resposta.status_code == 416
+
+
+def test_conexao_devolvida_ao_pool_entre_blocos(cliente, cabecalhos_admin, documento_no_banco):
+    pool = portal.db.engine.pool
+    resposta = _baixar(cliente, cabecalhos_admin, documento_no_banco)
+    assert resposta.status_code == 200
+    blocos = []
+    for bloco in resposta.response:
+        # Enquanto o cliente consome o bloco, nenhuma conexão está em uso
+        assert pool.checkedout() == 0
+        blocos.append(bloco)
+    resposta.close()
+    assert len(blocos) == len(CONTEUDO) // 1024
+    assert b''.join(blocos) == CONTEUDO
+
+
+def test_indice_de_arquivos_reconstruido_fora_do_lock(monkeypatch):
+    monkeypatch.setattr(portal, '_INDICE_ARQUIVOS', None)
+    construcoes = []
+
+    def construir():
+        # Downloads concorrentes continuam lendo o índice atual durante a varredura
+        assert not portal._INDICE_ARQUIVOS_LOCK.locked()
+        indice = portal.IndiceArquivosDocumentos([])
+        construcoes.append(indice)
+        return indice
+
+    monkeypatch.setattr(portal.IndiceArquivosDocumentos, 'construir', staticmethod(construir))
+
+    primeiro = portal._obter_indice_arquivos()
+    assert portal._obter_indice_arquivos() is primeiro
+    assert construcoes == [primeiro]
+
+    primeiro.construido_em -= portal.DOCUMENTOS_INDICE_TTL + 1
+    segundo = portal._obter_indice_arquivos()
+    assert segundo is not primeiro
+    assert portal._INDICE_ARQUIVOS is segundo
+    assert len(construcoes) == 2
@@ -0,0 +1,247 @@
+"""
+Fila persistente de e-mails (tabela emails_pendentes).
+
+O servidor SMTP é substituído por um mail.connect() falso que registra as
+mensagens recebidas ou falha sob demanda. Cobre o envio, o backoff após uma
+falha, o descarte após EMAIL_FILA_MAX_TENTATIVAS (inclusive de reservas que
+expiram sem resposta do worker), a disputa entre dois workers pela mesma
+mensagem, as métricas de envio calculadas a partir da tabela e a recusa de
+novos e-mails quando a fila não tem consumidor.
+"""
+import contextlib
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import app as portal
+
+
+class ServidorSMTPFalso:
+    """Substitui mail.connect(); falha enquanto `falhas_restantes` for positivo."""
+
+    def __init__(self):
+        self.recebidas = []
+        self.conexoes = 0
+        self.falhas_restantes = 0
+
+    @contextlib.contextmanager
+    def connect(self):
+        self.conexoes += 1
+        yield self
+
+    def send(self, mensagem):
+        if self.falhas_restantes:
+            self.falhas_restantes -= 1
+            raise ConnectionRefusedError('servidor SMTP indisponível')
+        self.recebidas.append(mensagem)
+
+
+@pytest.fixture
+def smtp(app_teste, monkeypatch):
+    servidor = ServidorSMTPFalso()
+    monkeypatch.setattr(portal.mail, 'connect', servidor.connect)
+    monkeypatch.setitem(app_teste.config, 'EMAIL_FILA_MAX_TENTATIVAS', 3)
+    monkeypatch.setitem(app_teste.config, 'EMAIL_FILA_ESPERA_BASE', 30)
+    return servidor
+
+
+def _enfileirar(posicao=1):
+    email = portal.enfileirar_email(f'destino{posicao}@exemplo.com', f'Assunto {posicao}', '<p>corpo</p>')
+    portal.db.session.commit()
+    return email.id
+
+
+def _vencer(email_id):
+    """Antecipa a próxima tentativa (ou o fim da reserva) para agora."""
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    email.proxima_tentativa_em = datetime.utcnow() - timedelta(seconds=1)
+    portal.db.session.commit()
+
+
+def test_enfileirar_e_processar_envia_uma_vez(smtp):
+    ids = [_enfileirar(posicao) for posicao in (1, 2)]
+
+    assert portal.processar_fila_emails() == (2, 0)
+    assert sorted(m.recipients[0] for m in smtp.recebidas) == ['destino1@exemplo.com', 'destino2@exemplo.com']
+    # As duas mensagens do lote usam a mesma sessão SMTP
+    assert smtp.conexoes == 1
+    for email_id in ids:
+        email = portal.db.session.get(portal.EmailPendente, email_id)
+        assert email.status == portal.EMAIL_ENVIADO
+        assert email.tentativas == 1
+        assert email.enviado_em is not None
+
+    assert portal.processar_fila_emails() == (0, 0)
+    assert len(smtp.recebidas) == 2
+
+
+def test_falha_agenda_nova_tentativa_com_backoff(smtp):
+    email_id = _enfileirar()
+    smtp.falhas_restantes = 1
+
+    antes = datetime.utcnow()
+    assert portal.processar_fila_emails() == (0, 1)
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    assert email.status == portal.EMAIL_PENDENTE
+    assert email.tentativas == 1
+    assert 'indisponível' in email.ultimo_erro
+    assert email.proxima_tentativa_em >= antes + timedelta(seconds=30)
+
+    # Antes do fim da espera a mensagem não é reenviada
+    assert portal.processar_fila_emails() == (0, 0)
+
+    _vencer(email_id)
+    smtp.falhas_restantes = 1
+    antes = datetime.utcnow()
+    assert portal.processar_fila_emails() == (0, 1)
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    # A espera dobra a cada tentativa
+    assert email.proxima_tentativa_em >= antes + timedelta(seconds=60)
+
+    _vencer(email_id)
+    assert portal.processar_fila_emails() == (1, 0)
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    assert email.status == portal.EMAIL_ENVIADO
+    assert email.tentativas == 3
+    assert email.ultimo_erro is None
+
+
+def test_falhou_apos_maximo_de_tentativas(smtp):
+    email_id = _enfileirar()
+    smtp.falhas_restantes = 10
+
+    for _ in range(3):
+        _vencer(email_id)
+        assert portal.processar_fila_emails() == (0, 1)
+
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    assert email.status == portal.EMAIL_FALHOU
+    assert email.tentativas == 3
+
+    _vencer(email_id)
+    assert portal.processar_fila_emails() == (0, 0)
+    assert smtp.recebidas == []
+
+
+def test_reserva_expirada_nao_e_retomada_apos_maximo_de_tentativas(smtp):
+    """Mensagem que derruba o worker a cada envio termina em FALHOU."""
+    email_id = _enfileirar()
+    for tentativa in range(1, 4):
+        _vencer(email_id)
+        # Worker reserva a mensagem e morre antes de registrar o resultado
+        assert portal._reservar_email(email_id, datetime.utcnow())
+        email = portal.db.session.get(portal.EmailPendente, email_id)
+        assert (email.status, email.tentativas) == (portal.EMAIL_ENVIANDO, tentativa)
+
+    _vencer(email_id)
+    assert not portal._reservar_email(email_id, datetime.utcnow())
+    assert portal.processar_fila_emails() == (0, 0)
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    assert email.status == portal.EMAIL_FALHOU
+    assert email.tentativas == 3
+    assert smtp.recebidas == []
+
+
+def test_dois_workers_disputando_a_mesma_mensagem(smtp, app_teste):
+    email_id = _enfileirar()
+    agora = datetime.utcnow()
+    largada = threading.Barrier(2)
+    resultados = []
+
+    def worker():
+        with app_teste.app_context():
+            try:
+                largada.wait()
+                resultados.append(portal._reservar_email(email_id, agora))
+            finally:
+                portal.db.session.remove()
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(resultados) == [False, True]
+    portal.db.session.expire_all()
+    email = portal.db.session.get(portal.EmailPendente, email_id)
+    assert (email.status, email.tentativas) == (portal.EMAIL_ENVIANDO, 1)
+
+
+def test_sem_consumidor_recusa_o_e_mail(cliente, monkeypatch):
+    monkeypatch.setitem(cliente.application.config, 'EMAIL_FILA_WORKER_THREAD', False)
+    monkeypatch.setitem(cliente.application.config, 'EMAIL_FILA_WORKER_EXTERNO', False)
+
+    resposta = cliente.post('/api/contato', json={
+        'nome': 'Fulano', 'email': 'fulano@exemplo.com', 'assunto': 'Teste', 'mensagem': 'Olá',
+    })
+    assert resposta.status_code == 503
+    assert portal.EmailPendente.query.count() == 0
+
+
+def test_metricas_vem_do_banco(cliente, cabecalhos_admin, smtp):
+    """As métricas não dependem do processo que enviou (worker separado)."""
+    enviado, com_falha = _enfileirar(1), _enfileirar(2)
+    smtp.falhas_restantes = 1
+    # A primeira mensagem do lote falha, a segunda é enviada
+    portal.db.session.get(portal.EmailPendente, com_falha).proxima_tentativa_em -= timedelta(minutes=1)
+    portal.db.session.commit()
+    assert portal.processar_fila_emails() == (1, 1)
+
+    emails = cliente.get('/api/admin/metricas', headers=cabecalhos_admin).get_json()['emails']
+    assert emails['profundidade'] == 1
+    assert emails['por_status'] == {portal.EMAIL_ENVIADO: 1, portal.EMAIL_PENDENTE: 1}
+    envios = emails['envios']
+    assert envios['enviados'] == 1
+    assert envios['tentativas_com_falha'] == 1
+    assert envios['mensagens_com_erro'] == 1
+    duracao = portal.db.session.get(portal.EmailPendente, enviado).duracao_envio_ms
+    assert duracao is not None
+    assert envios['latencia_media_ms'] == envios['latencia_max_ms'] == round(duracao, 2)
+
+
+def test_thread_de_envio_ligada_sem_worker_externo(monkeypatch):
+    import importlib
+
+    import config
+
+    monkeypatch.delenv('EMAIL_FILA_WORKER_THREAD', raising=False)
+    monkeypatch.delenv('EMAIL_FILA_WORKER_EXTERNO', raising=False)
+    try:
+        assert importlib.reload(config).Config.EMAIL_FILA_WORKER_THREAD is True
+        monkeypatch.setenv('EMAIL_FILA_WORKER_EXTERNO', 'true')
+        assert importlib.reload(config).Config.EMAIL_FILA_WORKER_THREAD is False
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
+def test_worker_continuo_sobrevive_a_erro_de_banco(app_teste, monkeypatch):
+    class Parar(Exception):
+        pass
+
+    rodadas = []
+
+    def processar(lote, conexao):
+        rodadas.append(lote)
+        if len(rodadas) == 1:
+            raise RuntimeError('banco indisponível')
+        return 0, 0
+
+    def dormir(_segundos):
+        if len(rodadas) >= 2:
+            raise Parar()
+
+    monkeypatch.setattr(portal, 'processar_fila_emails', processar)
+    monkeypatch.setattr(portal.time, 'sleep', dormir)
+    resultado = app_teste.test_cli_runner().invoke(args=['enviar-emails', '--continuo'])
+    assert isinstance(resultado.exception, Parar)
+    assert 'banco indisponível' in resultado.output
+    assert len(rodadas) == 2
+
+    # Sem --continuo o erro encerra o comando com mensagem
+    rodadas.clear()
+    resultado = app_teste.test_cli_runner().invoke(args=['enviar-emails'])
+    assert resultado.exit_code == 1
+    assert 'Falha ao processar a fila de e-mails' in resultado.output
@@ -0,0 +1,179 @@
+"""
+Importação das planilhas de homologação para o banco ('flask import-planilhas').
+
+Reimportar a mesma planilha não deve gravar nada, códigos repetidos não podem
+perder linhas, o controle de qualidade é substituído só para os agentes que
+mudaram e as consultas SQL devem responder o mesmo que os índices em memória
+das planilhas Excel.
+"""
+import math
+
+import pandas as pd
+import pytest
+
+import app as portal
+
+COLUNAS_HOMOLOGADOS = ['codigo', 'agente', 'nome_fantasia', 'cnpj', 'aprovado', 'nota_homologacao', 'iqf']
+
+
+@pytest.fixture(autouse=True)
+def planilhas_importadas_limpas(monkeypatch):
+    """Cada teste começa sem importação registrada neste processo."""
+    monkeypatch.setattr(portal, '_PLANILHAS_IMPORTADAS', {'versao': None, 'planilhas': (None, None)})
+
+
+def _homologados():
+    return pd.DataFrame([
+        (10, 'Alfa Engenharia Ltda', 'Alfa', '12.345.678/0001-90', 'SIM', 82.5, 90.0),
+        (11, 'Beta Serviços', 'Beta', '98.765.432/0001-10', 'NÃO', 55.0, float('nan')),
+        (10, 'Alfa Engenharia Filial', 'Alfa Filial', '12.345.678/0002-71', 'SIM', 78.0, 88.0),
+        (float('nan'), 'Gama Transportes', None, '11.222.333/0001-44', 'EM ANÁLISE', float('nan'), 70.0),
+    ], columns=COLUNAS_HOMOLOGADOS)
+
+
+def _controle():
+    return pd.DataFrame([
+        ('Alfa Engenharia Ltda', 90.0, 'Entrega no prazo'),
+        ('Beta Serviços', 60.0, 'Sem comentários'),
+        ('Alfa Engenharia Ltda', 80.0, None),
+        ('Beta Serviços', float('nan'), 'Atraso na obra'),
+        ('Alfa Engenharia Filial', 70.0, 'Documentação incompleta'),
+    ], columns=['nome_agente', 'nota', 'observacao'])
+
+
+def _sem_nan(valor):
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    return valor
+
+
+def _linha(resultado):
+    if resultado is None:
+        return None
+    return {coluna: _sem_nan(resultado[coluna]) for coluna in COLUNAS_HOMOLOGADOS}
+
+
+def test_reimportar_a_mesma_planilha_nao_grava_nada(app_teste):
+    primeiro = portal.importar_planilhas_homologacao(_homologados(), _controle())
+    assert primeiro['homologados'] == {'inseridos': 4, 'atualizados': 0, 'removidos': 0}
+    assert primeiro['controle_qualidade'] == {'inseridos': 5, 'removidos': 0}
+    gravados_em = {
+        registro.chave: registro.atualizado_em for registro in portal.HomologadoPlanilha.query
+    }
+    ids_controle = [registro.id for registro in portal.ControleQualidadePlanilha.query]
+
+    segundo = portal.importar_planilhas_homologacao(_homologados(), _controle())
+
+    assert segundo['homologados'] == {'inseridos': 0, 'atualizados': 0, 'removidos': 0}
+    assert segundo['controle_qualidade'] == {'inseridos': 0, 'removidos': 0}
+    assert segundo['agentes_alterados'] == []
+    assert {
+        registro.chave: registro.atualizado_em for registro in portal.HomologadoPlanilha.query
+    } == gravados_em
+    assert [registro.id for registro in portal.ControleQualidadePlanilha.query] == ids_controle
+
+
+def test_codigos_repetidos_recebem_sufixo_pela_ordem_da_planilha(app_teste):
+    portal.importar_planilhas_homologacao(_homologados())
+
+    chaves = {
+        registro.chave: registro.agente
+        for registro in portal.HomologadoPlanilha.query.order_by(portal.HomologadoPlanilha.linha)
+    }
+    assert chaves == {
+        'codigo:10': 'Alfa Engenharia Ltda',
+        'codigo:11': 'Beta Serviços',
+        'codigo:10#2': 'Alfa Engenharia Filial',
+        'agente:gama transportes|11222333000144': 'Gama Transportes',
+    }
+
+
+def test_controle_substitui_apenas_os_agentes_alterados(app_teste):
+    portal.importar_planilhas_homologacao(df_controle=_controle())
+    ids_beta = sorted(
+        registro.id for registro in portal.ControleQualidadePlanilha.query.filter_by(
+            agente_normalizado='beta servicos'
+        )
+    )
+    controle = _controle()
+    controle.loc[2, 'nota'] = 85.0
+
+    relatorio = portal.importar_planilhas_homologacao(df_controle=controle)
+
+    assert relatorio['controle_qualidade'] == {'inseridos': 2, 'removidos': 2}
+    assert relatorio['agentes_alterados'] == ['alfa engenharia ltda']
+    assert sorted(
+        registro.id for registro in portal.ControleQualidadePlanilha.query.filter_by(
+            agente_normalizado='beta servicos'
+        )
+    ) == ids_beta
+    notas_alfa = [
+        registro.nota for registro in portal.ControleQualidadePlanilha.query.filter_by(
+            agente_normalizado='alfa engenharia ltda'
+        ).order_by(portal.ControleQualidadePlanilha.linha)
+    ]
+    assert notas_alfa == [90.0, 85.0]
+
+
+def test_textos_longos_sao_importados_sem_limite_de_tamanho(app_teste):
+    for tabela, colunas in (
+        (portal.HomologadoPlanilha.__table__, ('chave', 'agente', 'nome_fantasia', 'cnpj', 'aprovado')),
+        (portal.ControleQualidadePlanilha.__table__, ('nome_agente', 'agente_normalizado')),
+    ):
+        for coluna in colunas:
+            assert getattr(tabela.c[coluna].type, 'length', None) is None, coluna
+
+    agente = 'Consórcio ' + 'Construtora Muito Extensa ' * 20
+    homologados = pd.DataFrame([
+        (float('nan'), agente, None, 'CNPJ pendente de confirmação', 'Aprovado com ressalvas', 70.0, float('nan')),
+    ], columns=COLUNAS_HOMOLOGADOS)
+    portal.importar_planilhas_homologacao(homologados)
+
+    registro = portal.HomologadoPlanilha.query.one()
+    assert registro.agente == agente.strip()
+    assert registro.aprovado == 'Aprovado com ressalvas'
+
+
+@pytest.mark.parametrize('nome, cnpj', [
+    ('Alfa Engenharia Ltda', None),
+    ('ALFA', None),
+    ('alfa filial', None),
+    ('Nome diferente', '12345678000190'),
+    ('Gama Transportes', None),
+    ('Inexistente', '00.000.000/0000-00'),
+])
+def test_consulta_sql_localiza_como_o_indice_em_memoria(app_teste, nome, cnpj):
+    df = _homologados()
+    portal.importar_planilhas_homologacao(df)
+
+    esperado = _linha(portal.IndiceHomologados(df).localizar(nome, cnpj))
+    assert _linha(portal.ConsultaHomologadosSQL().localizar(nome, cnpj)) == esperado
+
+
+@pytest.mark.parametrize('termo', ['Beta Serviços', 'engenharia', 'filial', 'inexistente'])
+def test_consulta_sql_busca_por_nome_como_o_indice_em_memoria(app_teste, termo):
+    df = _homologados()
+    portal.importar_planilhas_homologacao(df)
+
+    esperado = _linha(portal.IndiceHomologados(df).buscar_por_nome(termo))
+    assert _linha(portal.ConsultaHomologadosSQL().buscar_por_nome(termo)) == esperado
+
+
+@pytest.mark.parametrize('nome_planilha, nome_busca', [
+    ('Alfa Engenharia Ltda', 'Alfa'),
+    ('Beta Serviços', 'Beta'),
+    (None, 'Alfa Engenharia'),
+    ('Não cadastrado', 'Inexistente'),
+])
+def test_consulta_sql_de_controle_como_o_indice_em_memoria(app_teste, nome_planilha, nome_busca):
+    df = _controle()
+    portal.importar_planilhas_homologacao(df_controle=df)
+
+    esperado = portal.IndiceControleQualidade(df).estatisticas(nome_planilha, nome_busca)
+    resultado = portal.ConsultaControleSQL().estatisticas(nome_planilha, nome_busca)
+
+    assert resultado[1:] == esperado[1:]
+    if esperado[0] is None:
+        assert resultado[0] is None
+    else:
+        assert resultado[0] == pytest.approx(esperado[0])
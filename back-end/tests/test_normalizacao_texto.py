@@ -0,0 +1,82 @@
+"""
+Normalizações de texto por coluna x valor a valor.
+
+_normalizar_texto_serie, _normalizar_chave_serie e _normalize_text_series
+devem devolver, para qualquer coluna, exatamente o que as versões escalares
+devolvem elemento a elemento. Os valores são sorteados com sementes fixas
+(letras acentuadas, marcas combinantes, espaços Unicode, code points de todos
+os planos, números e nulos), com repetições para passar pela deduplicação.
+"""
+import random
+import sys
+
+import pytest
+
+import app as portal
+
+pd = portal.pd
+
+PARES = [
+    pytest.param(portal._normalizar_texto, portal._normalizar_texto_serie, id='_normalizar_texto'),
+    pytest.param(portal._normalizar_chave, portal._normalizar_chave_serie, id='_normalizar_chave'),
+    pytest.param(portal._normalize_text, portal._normalize_text_series, id='_normalize_text'),
+]
+
+ESPECIAIS = [
+    'ç', 'Ç', 'ã', 'Ã', 'ç', 'ã', 'Ã', 'é', 'é', 'ß', 'ǰ', 'İ',
+    'ı', 'ͅ', 'ﬁ', '①', '½', '²', '_', '-', '/', '.', '&', '\x00',
+    ' ', '  ', '\t', '\n', ' ', ' ', '　', '​',
+]
+COMBINANTES = [chr(codigo) for codigo in range(0x300, 0x370)]
+
+
+def _caractere(gerador):
+    sorteio = gerador.random()
+    if sorteio < 0.35:
+        return gerador.choice('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+    if sorteio < 0.6:
+        return gerador.choice(ESPECIAIS)
+    if sorteio < 0.75:
+        return gerador.choice(COMBINANTES)
+    while True:
+        codigo = gerador.randrange(0x80, sys.maxunicode + 1 if sorteio < 0.8 else 0x3100)
+        if not 0xD800 <= codigo <= 0xDFFF:
+            return chr(codigo)
+
+
+def _valores(semente, quantidade=400, com_nulos=True):
+    gerador = random.Random(semente)
+    valores = []
+    for _ in range(quantidade):
+        sorteio = gerador.random()
+        if valores and sorteio < 0.15:
+            valores.append(gerador.choice(valores))
+        elif com_nulos and sorteio < 0.25:
+            valores.append(gerador.choice([
+                None, float('nan'), gerador.randint(-10 ** 6, 10 ** 6),
+                gerador.uniform(-1000, 1000), 0, 0.0,
+            ]))
+        else:
+            valores.append(''.join(_caractere(gerador) for _ in range(gerador.randint(0, 12))))
+    return valores
+
+
+@pytest.mark.parametrize('escalar, por_coluna', PARES)
+@pytest.mark.parametrize('semente', range(20))
+def test_coluna_mista_igual_ao_escalar(escalar, por_coluna, semente):
+    valores = _valores(semente)
+    assert por_coluna(pd.Series(valores)).tolist() == [escalar(valor) for valor in valores]
+
+
+@pytest.mark.parametrize('escalar, por_coluna', PARES)
+@pytest.mark.parametrize('semente', range(20))
+def test_coluna_de_textos_igual_ao_escalar(escalar, por_coluna, semente):
+    # Só textos: o pandas infere o dtype str em vez de object
+    valores = _valores(semente, com_nulos=False)
+    serie = pd.Series(valores)
+    assert por_coluna(serie).tolist() == [escalar(valor) for valor in valores]
+
+
+@pytest.mark.parametrize('escalar, por_coluna', PARES)
+def test_coluna_vazia(escalar, por_coluna):
+    assert por_coluna(pd.Series([], dtype=object)).tolist() == []
@@ -0,0 +1,68 @@
+"""
+Tokens de recuperação de senha (tabela password_resets).
+
+O token de 6 dígitos só vale junto com o e-mail do fornecedor que o pediu, e
+tokens errados para esse e-mail esgotam o pedido depois de
+TOKEN_RECUPERACAO_MAX_TENTATIVAS tentativas.
+"""
+import pytest
+
+import app as portal
+
+
+@pytest.fixture
+def tokens(app_teste, monkeypatch):
+    """Cadastra dois fornecedores e devolve o token gerado para cada e-mail."""
+    gerados = {}
+    for posicao in (1, 2):
+        fornecedor = portal.Fornecedor(
+            nome=f'Fornecedor {posicao}',
+            email=f'fornecedor{posicao}@exemplo.com',
+            cnpj=f'{posicao:014d}',
+            senha='hash',
+            categoria='Material',
+        )
+        portal.db.session.add(fornecedor)
+        portal.db.session.flush()
+        gerados[fornecedor.email] = portal._criar_redefinicao_senha(fornecedor)
+    portal.db.session.commit()
+    monkeypatch.setattr(portal, '_gerar_hash_senha', lambda senha: f'hash:{senha}')
+    return gerados
+
+
+def _validar(cliente, **dados):
+    return cliente.post('/api/validar-token', json=dados)
+
+
+def test_token_exige_email(cliente, tokens):
+    token = tokens['fornecedor1@exemplo.com']
+    assert _validar(cliente, token=token).status_code == 400
+    resposta = cliente.post('/api/redefinir-senha', json={'token': token, 'nova_senha': 'Nova@123'})
+    assert resposta.status_code == 400
+
+
+def test_token_vale_apenas_para_o_proprio_email(cliente, tokens):
+    token = tokens['fornecedor1@exemplo.com']
+    assert _validar(cliente, token=token, email='fornecedor2@exemplo.com').status_code == 404
+    assert _validar(cliente, token=token, email='FORNECEDOR1@exemplo.com').status_code == 200
+
+    resposta = cliente.post('/api/redefinir-senha', json={
+        'token': token, 'email': 'fornecedor1@exemplo.com', 'nova_senha': 'Nova@123',
+    })
+    assert resposta.status_code == 200
+    fornecedor = portal._buscar_fornecedor_por_email('fornecedor1@exemplo.com')
+    assert fornecedor.senha == 'hash:Nova@123'
+    # Uso único
+    assert _validar(cliente, token=token, email='fornecedor1@exemplo.com').status_code == 404
+
+
+def test_tokens_errados_esgotam_o_pedido(cliente, tokens):
+    email = 'fornecedor1@exemplo.com'
+    token = tokens[email]
+    errado = '000000' if token != '000000' else '111111'
+    for _ in range(portal.app.config['TOKEN_RECUPERACAO_MAX_TENTATIVAS']):
+        assert _validar(cliente, token=errado, email=email).status_code == 404
+    assert _validar(cliente, token=token, email=email).status_code == 404
+    # O pedido do outro fornecedor não é afetado
+    outro = 'fornecedor2@exemplo.com'
+    assert _validar(cliente, token=tokens[outro], email=outro).status_code == 200
@@ -0,0 +1,98 @@
+"""
+Pool limitado de hash de senhas (senhas.ExecutorSenhas).
+
+Cobre a recusa com a fila cheia (503 com Retry-After no login), a espera
+esgotada, que mantém a vaga ocupada até o processo terminar, e o modo
+processos=0, que executa o hash na própria thread.
+"""
+import time
+
+import pytest
+
+import app as portal
+import senhas
+
+METODO_BARATO = 'pbkdf2:sha256:1000'
+
+
+@pytest.fixture
+def executor(app_teste, monkeypatch):
+    """Instala um ExecutorSenhas próprio do teste no lugar do pool do processo."""
+    criados = []
+
+    def instalar(**opcoes):
+        novo = senhas.ExecutorSenhas(**opcoes)
+        criados.append(novo)
+        monkeypatch.setattr(portal, '_EXECUTOR_SENHAS', novo)
+        return novo
+
+    monkeypatch.setitem(app_teste.config, 'SENHA_PBKDF2_ITERACOES', 1000)
+    yield instalar
+    for criado in criados:
+        criado.encerrar()
+
+
+@pytest.fixture
+def fornecedor(app_teste):
+    fornecedor = portal.Fornecedor(
+        nome='Fornecedor 1',
+        email='fornecedor1@exemplo.com',
+        cnpj='00000000000001',
+        senha=senhas.gerar_hash_senha('Senha@123', METODO_BARATO),
+        categoria='Material',
+    )
+    portal.db.session.add(fornecedor)
+    portal.db.session.commit()
+    return fornecedor
+
+
+def _login(cliente, senha='Senha@123'):
+    return cliente.post('/api/login', json={'email': 'fornecedor1@exemplo.com', 'senha': senha})
+
+
+def test_fila_cheia_responde_503_com_retry_after(cliente, executor, fornecedor):
+    pool = executor(processos=0, fila=1, retry_after=7)
+    # Ocupa as duas vagas (processos=0 conta como uma) como se houvesse
+    # logins em andamento em outras threads
+    assert pool._vagas.acquire(blocking=False)
+    assert pool._vagas.acquire(blocking=False)
+
+    resposta = _login(cliente)
+    assert resposta.status_code == 503
+    assert resposta.headers['Retry-After'] == '7'
+    assert pool.estatisticas()['rejeitadas'] == 1
+
+    pool._vagas.release()
+    assert _login(cliente).status_code == 200
+
+
+def test_espera_esgotada_mantem_a_vaga_ate_o_fim_do_processo(app_teste, executor):
+    pool = executor(processos=1, fila=0, espera_maxima=0.2, retry_after=3)
+
+    with pytest.raises(senhas.SobrecargaSenhasError) as erro:
+        pool._executar(time.sleep, 3)
+    assert erro.value.retry_after == 3
+    estatisticas = pool.estatisticas()
+    assert estatisticas['esgotadas'] == 1
+    assert estatisticas['em_andamento'] == 1
+
+    # A única vaga continua com o processo que não terminou
+    with pytest.raises(senhas.SobrecargaSenhasError):
+        pool.verificar(senhas.gerar_hash_senha('x', METODO_BARATO), 'x')
+    assert pool.estatisticas()['rejeitadas'] == 1
+
+
+def test_processos_zero_executa_na_propria_thread(cliente, executor, fornecedor):
+    pool = executor(processos=0, fila=0)
+
+    hash_gerado = pool.gerar_hash('Outra@123', METODO_BARATO)
+    assert pool.verificar(hash_gerado, 'Outra@123')
+    assert not pool.verificar(hash_gerado, 'errada')
+    assert pool._pool is None
+
+    assert _login(cliente).status_code == 200
+    assert _login(cliente, 'errada').status_code == 401
+    estatisticas = pool.estatisticas()
+    assert estatisticas['concluidas'] == 5
+    assert estatisticas['em_andamento'] == 0
+    assert estatisticas['capacidade'] == 1
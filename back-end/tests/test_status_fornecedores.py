@@ -0,0 +1,160 @@
+"""
+Projeção fornecedor_status (status calculado de cada fornecedor).
+
+Cada alteração de um fornecedor (cadastro, upload, nota, decisão individual ou
+em lote) deve regravar só a linha dele, e uma falha ao ler as planilhas não
+pode recalcular a projeção inteira com status degradados.
+"""
+import io
+
+import pandas as pd
+import pytest
+
+import app as portal
+
+PLANILHAS_VAZIAS = (None, None)
+
+
+@pytest.fixture
+def sem_planilhas(app_teste, monkeypatch):
+    """Status calculados sem planilhas, independentemente dos .xlsx do projeto."""
+    monkeypatch.setattr(portal, '_carregar_planilhas_homologacao', lambda propagar_erros=False: PLANILHAS_VAZIAS)
+
+
+@pytest.fixture
+def fornecedores(sem_planilhas):
+    """Três fornecedores com a projeção já sincronizada."""
+    ids = []
+    for posicao in range(3):
+        fornecedor = portal.Fornecedor(
+            nome=f'Fornecedor {posicao}',
+            email=f'fornecedor{posicao}@exemplo.com',
+            cnpj=f'{posicao:014d}',
+            senha='hash',
+            categoria='Material',
+        )
+        portal.db.session.add(fornecedor)
+        portal.db.session.flush()
+        ids.append(fornecedor.id)
+    portal._atualizar_status_fornecedores()
+    portal.db.session.commit()
+    return ids
+
+
+def _projecao():
+    portal.db.session.expire_all()
+    return {
+        registro.fornecedor_id: (
+            registro.status, registro.nota_homologacao, registro.iqf_final,
+            registro.total_documentos, registro.ultima_atividade, registro.atualizado_em,
+        )
+        for registro in portal.FornecedorStatus.query
+    }
+
+
+def _linhas_alteradas(antes, depois):
+    return {
+        fornecedor_id for fornecedor_id in set(antes) | set(depois)
+        if antes.get(fornecedor_id) != depois.get(fornecedor_id)
+    }
+
+
+def test_cadastro_insere_somente_a_linha_do_novo_fornecedor(cliente, fornecedores):
+    antes = _projecao()
+
+    resposta = cliente.post('/api/cadastro', json={
+        'nome': 'Fornecedor Novo', 'cnpj': '99.999.999/0001-99',
+        'email': 'novo@exemplo.com', 'senha': 'senha-segura-123',
+    })
+
+    assert resposta.status_code == 201
+    novo_id = portal.Fornecedor.query.filter_by(email='novo@exemplo.com').one().id
+    depois = _projecao()
+    assert _linhas_alteradas(antes, depois) == {novo_id}
+    assert depois[novo_id][0] == 'A CADASTRAR'
+
+
+def test_upload_atualiza_somente_a_linha_do_fornecedor(cliente, fornecedores, tmp_path, monkeypatch):
+    monkeypatch.setattr(portal, 'UPLOAD_FOLDER', str(tmp_path))
+    monkeypatch.setattr(portal, 'BLOB_FOLDER', str(tmp_path / 'blobs'))
+    antes = _projecao()
+
+    resposta = cliente.post('/api/envio-documento', data={
+        'fornecedor_id': str(fornecedores[1]),
+        'categoria': 'Material',
+        'arquivos': [(io.BytesIO(b'%PDF-1.4 conteudo'), 'certidao.pdf')],
+    }, content_type='multipart/form-data')
+
+    assert resposta.status_code == 200
+    depois = _projecao()
+    assert _linhas_alteradas(antes, depois) == {fornecedores[1]}
+    assert depois[fornecedores[1]][3] == 1
+
+
+def test_nota_atualiza_somente_a_linha_do_fornecedor(cliente, cabecalhos_admin, fornecedores):
+    antes = _projecao()
+
+    resposta = cliente.patch(
+        f'/api/admin/fornecedores/{fornecedores[0]}/notas',
+        json={'notaHomologacao': 85},
+        headers=cabecalhos_admin,
+    )
+
+    assert resposta.status_code == 200
+    depois = _projecao()
+    assert _linhas_alteradas(antes, depois) == {fornecedores[0]}
+    assert depois[fornecedores[0]][1] == 85.0
+
+
+def test_decisao_atualiza_somente_a_linha_do_fornecedor(cliente, cabecalhos_admin, fornecedores):
+    antes = _projecao()
+
+    resposta = cliente.post(
+        f'/api/admin/fornecedores/{fornecedores[2]}/decisao',
+        json={'status': 'REPROVADO', 'enviarEmail': False},
+        headers=cabecalhos_admin,
+    )
+
+    assert resposta.status_code == 200
+    depois = _projecao()
+    assert _linhas_alteradas(antes, depois) == {fornecedores[2]}
+    assert depois[fornecedores[2]][0] == 'REPROVADO'
+
+
+def test_decisoes_em_lote_atualizam_somente_as_linhas_decididas(cliente, cabecalhos_admin, fornecedores):
+    antes = _projecao()
+
+    resposta = cliente.post('/api/admin/fornecedores/decisoes', json={'decisoes': [
+        {'fornecedorId': fornecedores[0], 'status': 'APROVADO', 'enviarEmail': False},
+        {'fornecedorId': fornecedores[2], 'status': 'EM_ANALISE', 'enviarEmail': False},
+    ]}, headers=cabecalhos_admin)
+
+    assert resposta.status_code == 200
+    depois = _projecao()
+    assert _linhas_alteradas(antes, depois) == {fornecedores[0], fornecedores[2]}
+    assert depois[fornecedores[0]][0] == 'APROVADO'
+    assert depois[fornecedores[2]][0] == 'EM_ANALISE'
+
+
+def test_falha_ao_recarregar_planilhas_mantem_a_projecao(fornecedores, monkeypatch):
+    planilhas = (
+        pd.DataFrame([
+            (1, 'Fornecedor 0', None, None, 'SIM', 90.0, 90.0),
+        ], columns=['codigo', 'agente', 'nome_fantasia', 'cnpj', 'aprovado', 'nota_homologacao', 'iqf']),
+        None,
+    )
+    monkeypatch.setattr(portal, '_carregar_planilhas_homologacao', lambda propagar_erros=False: planilhas)
+    assert portal._sincronizar_status_com_planilhas() is planilhas
+    sincronizada = _projecao()
+    assert sincronizada[fornecedores[0]][0] != 'A CADASTRAR'
+
+    def carregar_com_erro(propagar_erros=False):
+        if not propagar_erros:
+            return PLANILHAS_VAZIAS
+        raise OSError('planilha bloqueada')
+
+    monkeypatch.setattr(portal, '_carregar_planilhas_homologacao', carregar_com_erro)
+
+    assert portal._sincronizar_status_com_planilhas() is planilhas
+    assert _projecao() == sincronizada
+    assert portal._STATUS_PLANILHAS_SINCRONIZADAS is planilhas